@@ -7,6 +7,7 @@ This package contains:
 """
 
 import os
+from functools import lru_cache
 
 DATA_PATH = os.path.dirname(__file__)
 
@@ -14,12 +15,13 @@ def get_data_path(filename):
     """Get absolute path to data file."""
     return os.path.join(DATA_PATH, filename)
 
+@lru_cache(maxsize=1)
+def _scan_data_files():
+    """Scan the data directory once; its contents are static at runtime."""
+    return tuple(f for f in os.listdir(DATA_PATH) if f.endswith('.json'))
+
 def list_data_files():
     """List available data files."""
-    files = []
-    for file in os.listdir(DATA_PATH):
-        if file.endswith('.json') and file != '__init__.py':
-            files.append(file)
-    return files
+    return list(_scan_data_files())
 
 __all__ = ['get_data_path', 'list_data_files']
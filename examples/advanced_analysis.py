@@ -26,11 +26,13 @@ def advanced_performance_analysis():
     print("Alt (m) | Vel (m/s) | Thrust (kN) | L/D Ratio | Stall (m/s)")
     print("-" * 60)
     
-    for alt in altitudes:
-        for vel in velocities:
-            perf = performance.performance_at_condition(alt, vel)
-            print(f"{alt:7.0f} | {vel:9.0f} | {perf['required_thrust']/1000:10.2f} | "
-                  f"{perf['lift_to_drag_ratio']:9.2f} | {perf['stall_speed']:10.2f}")
+    # Evaluate the whole altitude x velocity grid in one call
+    perf = performance.performance_at_conditions(altitudes, velocities)
+
+    for i, alt in enumerate(altitudes):
+        for j, vel in enumerate(velocities):
+            print(f"{alt:7.0f} | {vel:9.0f} | {perf['required_thrust'][i, j]/1000:10.2f} | "
+                  f"{perf['lift_to_drag_ratio'][i, j]:9.2f} | {perf['stall_speed'][i, j]:10.2f}")
 
 def optimal_cruise_analysis():
     """Find optimal cruise conditions"""
@@ -43,22 +45,17 @@ def optimal_cruise_analysis():
     altitudes = np.arange(5000, 13000, 500)
     cruise_speed = 250  # m/s
     
-    best_altitude = 0
-    best_LD_ratio = 0
-    
-    for alt in altitudes:
-        perf = performance.performance_at_condition(alt, cruise_speed)
-        if perf['lift_to_drag_ratio'] > best_LD_ratio:
-            best_LD_ratio = perf['lift_to_drag_ratio']
-            best_altitude = alt
+    perf = performance.performance_at_conditions(altitudes, cruise_speed)
+    LD = perf['lift_to_drag_ratio'][:, 0]
+    best = int(LD.argmax())
+    best_altitude = altitudes[best]
     
     print(f"Optimal cruise altitude: {best_altitude:,} m")
-    print(f"Best L/D ratio: {best_LD_ratio:.2f}")
+    print(f"Best L/D ratio: {LD[best]:.2f}")
     
     # Show performance at optimal altitude
-    optimal_perf = performance.performance_at_condition(best_altitude, cruise_speed)
-    print(f"Required thrust: {optimal_perf['required_thrust']/1000:.2f} kN")
-    print(f"Stall speed: {optimal_perf['stall_speed']:.2f} m/s")
+    print(f"Required thrust: {perf['required_thrust'][best, 0]/1000:.2f} kN")
+    print(f"Stall speed: {perf['stall_speed'][best, 0]:.2f} m/s")
 
 def custom_aircraft_analysis():
     """Analysis with custom aircraft parameters"""
@@ -84,9 +81,9 @@ def custom_aircraft_analysis():
     perf = performance.performance_at_condition(altitude, velocity)
     
     print(f"Custom Business Jet at {altitude:,} m, {velocity} m/s:")
-    print(f"  Required Thrust: {perf['required_thrust']/1000:.2f} kN")
-    print(f"  L/D Ratio: {perf['lift_to_drag_ratio']:.2f}")
-    print(f"  Stall Speed: {perf['stall_speed']:.2f} m/s")
+    print(f"  Required Thrust: {perf.required_thrust/1000:.2f} kN")
+    print(f"  L/D Ratio: {perf.lift_to_drag_ratio:.2f}")
+    print(f"  Stall Speed: {perf.stall_speed:.2f} m/s")
 
 if __name__ == "__main__":
     advanced_performance_analysis()
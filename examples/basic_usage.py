@@ -4,6 +4,8 @@ Basic usage examples for the Standard Atmosphere Analyzer
 
 import sys
 import os
+import matplotlib
+matplotlib.use('Agg')  # Non-interactive backend; figures are only saved to disk
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from src.atmosphere_model import StandardAtmosphere
@@ -42,27 +44,27 @@ def example_aircraft_performance():
     perf = performance.performance_at_condition(altitude, velocity)
     
     print(f"\nPerformance at {altitude:,} m, {velocity} m/s:")
-    print(f"  Lift Coefficient (CL): {perf['lift_coefficient']:.4f}")
-    print(f"  Drag Coefficient (CD): {perf['drag_coefficient']:.4f}")
-    print(f"  Lift Force: {perf['lift_force']/1000:.2f} kN")
-    print(f"  Drag Force: {perf['drag_force']/1000:.2f} kN")
-    print(f"  Required Thrust: {perf['required_thrust']/1000:.2f} kN")
-    print(f"  Lift-to-Drag Ratio: {perf['lift_to_drag_ratio']:.2f}")
-    print(f"  Stall Speed: {perf['stall_speed']:.2f} m/s")
+    print(f"  Lift Coefficient (CL): {perf.lift_coefficient:.4f}")
+    print(f"  Drag Coefficient (CD): {perf.drag_coefficient:.4f}")
+    print(f"  Lift Force: {perf.lift_force/1000:.2f} kN")
+    print(f"  Drag Force: {perf.drag_force/1000:.2f} kN")
+    print(f"  Required Thrust: {perf.required_thrust/1000:.2f} kN")
+    print(f"  Lift-to-Drag Ratio: {perf.lift_to_drag_ratio:.2f}")
+    print(f"  Stall Speed: {perf.stall_speed:.2f} m/s")
 
 def example_visualization():
     """Example of generating visualizations"""
     print("\n=== Visualization Example ===")
     
     atm = StandardAtmosphere()
-    visualizer = AtmosphereVisualizer()
+    visualizer = AtmosphereVisualizer(dpi=150)
     
     # Generate altitude profile
     profile = atm.generate_altitude_profile(max_altitude=20000, step=500)
     
     # Create and save plot
     fig = visualizer.plot_atmospheric_properties(profile)
-    fig.savefig('atmosphere_profile.png', dpi=300, bbox_inches='tight')
+    fig.savefig('atmosphere_profile.png')
     print("Atmosphere profile saved as 'atmosphere_profile.png'")
 
 if __name__ == "__main__":
@@ -4,6 +4,7 @@ Custom Aircraft Configuration Examples
 
 import sys
 import os
+import pandas as pd
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from src.atmosphere_model import StandardAtmosphere
@@ -51,20 +52,24 @@ def load_and_use_custom_aircraft():
     altitude = 11000  # meters (typical cruise altitude)
     velocity = 230    # m/s
     
-    print(f"\nPerformance comparison at {altitude:,} m, {velocity} m/s:")
-    print("-" * 70)
-    print(f"{'Aircraft':<20} {'Thrust (kN)':<12} {'L/D Ratio':<10} {'Stall (m/s)':<12}")
-    print("-" * 70)
+    # Collect each parameter across the fleet so all aircraft are evaluated in one pass
+    aircraft = list(config['aircraft_types'].values())
+    fleet_params = {
+        name: [params[name] for params in aircraft]
+        for name in ('wing_area', 'mass', 'max_lift_coeff',
+                     'zero_lift_drag', 'oswald_efficiency', 'aspect_ratio')
+    }
+    perf = performance.performance_for_aircraft(altitude, velocity, fleet_params)
     
-    for aircraft_type, params in config['aircraft_types'].items():
-        # Set aircraft parameters
-        performance.set_aircraft_parameters(**params)
-        
-        # Calculate performance
-        perf = performance.performance_at_condition(altitude, velocity)
-        
-        print(f"{params['name']:<20} {perf['required_thrust']/1000:<12.2f} "
-              f"{perf['lift_to_drag_ratio']:<10.2f} {perf['stall_speed']:<12.2f}")
+    comparison = pd.DataFrame({
+        'Aircraft': [params['name'] for params in aircraft],
+        'Thrust (kN)': perf['required_thrust'] / 1000,
+        'L/D Ratio': perf['lift_to_drag_ratio'],
+        'Stall (m/s)': perf['stall_speed']
+    })
+    
+    print(f"\nPerformance comparison at {altitude:,} m, {velocity} m/s:")
+    print(comparison.to_string(index=False, float_format='{:.2f}'.format))
 
 def create_ultralight_config():
     """Create configuration for an ultralight aircraft"""
@@ -97,9 +102,9 @@ def create_ultralight_config():
     perf = performance.performance_at_condition(altitude, velocity)
     
     print(f"\nUltralight Aircraft at {altitude:,} m, {velocity} m/s:")
-    print(f"  Required Thrust: {perf['required_thrust']:.1f} N")
-    print(f"  Lift-to-Drag Ratio: {perf['lift_to_drag_ratio']:.2f}")
-    print(f"  Stall Speed: {perf['stall_speed']:.2f} m/s")
+    print(f"  Required Thrust: {perf.required_thrust:.1f} N")
+    print(f"  Lift-to-Drag Ratio: {perf.lift_to_drag_ratio:.2f}")
+    print(f"  Stall Speed: {perf.stall_speed:.2f} m/s")
     
     return ultralight
 
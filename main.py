@@ -1,9 +1,98 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
-from atmosphere_model import StandardAtmosphere
-from aircraft_performance import AircraftPerformance
-from visualization import AtmosphereVisualizer
+from src.atmosphere_model import TabulatedAtmosphere
+from src.aircraft_performance import AircraftPerformance
+from src.visualization import AtmosphereVisualizer
+
+def _number_columns(formats):
+    """Column config that lets the frontend format numbers instead of a Python Styler"""
+    return {name: st.column_config.NumberColumn(format=fmt) for name, fmt in formats.items()}
+
+PROFILE_COLUMN_CFG = _number_columns({
+    'Altitude (m)': '%.0f',
+    'Altitude (km)': '%.2f',
+    'Temperature (°C)': '%.2f',
+    'Pressure (Pa)': '%.2f',
+    'Density (kg/m³)': '%.4f',
+    'Speed of Sound (m/s)': '%.2f'
+})
+
+PERFORMANCE_COLUMN_CFG = _number_columns({
+    'altitude': '%.0f',
+    'altitude_km': '%.2f',
+    'lift_coefficient': '%.4f',
+    'drag_coefficient': '%.4f',
+    'lift_force': '%.2f',
+    'drag_force': '%.2f',
+    'lift_to_drag_ratio': '%.2f',
+    'required_thrust': '%.2f',
+    'stall_speed': '%.2f'
+})
+
+THRUST_COLUMN_CFG = _number_columns({
+    'velocity': '%.1f',
+    'mach_number': '%.3f',
+    'required_thrust_kN': '%.2f',
+    'drag_force_kN': '%.2f',
+    'lift_coefficient': '%.4f',
+    'drag_coefficient': '%.4f',
+    'L_D_ratio': '%.2f'
+})
+
+@st.cache_data
+def compute_profile(max_altitude, step):
+    """Generate the atmosphere profile, cached on its inputs"""
+    # Single precision is ample for the plots and the 4-decimal table
+    return TabulatedAtmosphere().generate_altitude_profile(
+        max_altitude=max_altitude, step=step, dtype=np.float32
+    )
+
+@st.cache_data
+def compute_profile_table(max_altitude, step):
+    """Build the display table for the atmosphere profile, cached on its inputs"""
+    df_profile = pd.DataFrame(compute_profile(max_altitude, step))
+    df_display = df_profile[['altitude', 'temperature_c', 'pressure', 'density', 'speed_of_sound']].copy()
+    df_display.columns = ['Altitude (m)', 'Temperature (°C)', 'Pressure (Pa)', 'Density (kg/m³)', 'Speed of Sound (m/s)']
+    df_display['Altitude (km)'] = df_display['Altitude (m)'] / 1000
+    return df_display
+
+def _performance_model(aircraft_params):
+    """Build a performance model from a hashable tuple of (name, value) pairs"""
+    performance = AircraftPerformance(TabulatedAtmosphere())
+    performance.set_aircraft_parameters(**dict(aircraft_params))
+    return performance
+
+@st.cache_data
+def compute_performance_curve(aircraft_params, min_alt, max_alt, alt_step, velocity):
+    """Sweep performance over altitude at a fixed velocity, cached on its inputs"""
+    altitudes = np.arange(min_alt, max_alt + alt_step, alt_step)
+    perf_grid = _performance_model(aircraft_params).performance_at_conditions(altitudes, velocity)
+    df_perf = pd.DataFrame({key: values[:, 0] for key, values in perf_grid.items()})
+    return altitudes, df_perf
+
+@st.cache_data
+def compute_thrust_drag(aircraft_params, altitude, min_vel, max_vel, vel_step):
+    """
+    Sweep performance over velocity at a fixed altitude, cached on its inputs
+    Returns the velocities, the PerfResult of arrays and the display table
+    """
+    velocities = np.arange(min_vel, max_vel + vel_step, vel_step)
+    performance = _performance_model(aircraft_params)
+
+    # Atmosphere is fixed at the analysis altitude, so look it up once
+    atm_props = performance.atm.get_atmospheric_properties(altitude)
+    perf = performance.performance_at_condition_array(altitude, velocities)
+
+    return velocities, perf, pd.DataFrame({
+        'velocity': velocities,
+        'mach_number': velocities / atm_props['speed_of_sound'],
+        'required_thrust_kN': perf.required_thrust / 1000,
+        'drag_force_kN': perf.drag_force / 1000,
+        'lift_coefficient': perf.lift_coefficient,
+        'drag_coefficient': perf.drag_coefficient,
+        'L_D_ratio': perf.lift_to_drag_ratio
+    })
 
 def main():
     st.set_page_config(
@@ -34,10 +123,14 @@ def main():
     st.markdown('<h1 class="main-header">✈️ Standard Atmosphere & Aircraft Performance Analyzer</h1>', 
                 unsafe_allow_html=True)
     
-    # Initialize models
-    atm_model = StandardAtmosphere()
-    performance_calc = AircraftPerformance(atm_model)
-    visualizer = AtmosphereVisualizer()
+    # Initialize models once per session; Streamlit reruns this script on every interaction
+    if 'performance_calc' not in st.session_state:
+        atm_model = TabulatedAtmosphere()
+        st.session_state.performance_calc = AircraftPerformance(atm_model)
+        st.session_state.visualizer = AtmosphereVisualizer(reuse_figures=True)
+    performance_calc = st.session_state.performance_calc
+    atm_model = performance_calc.atm
+    visualizer = st.session_state.visualizer
     
     # Sidebar for user inputs
     st.sidebar.header("Configuration Settings")
@@ -50,14 +143,18 @@ def main():
     zero_lift_drag = st.sidebar.number_input("Zero-Lift Drag Coefficient", value=0.02, min_value=0.001, max_value=0.1)
     aspect_ratio = st.sidebar.number_input("Aspect Ratio", value=9.5, min_value=5.0, max_value=20.0)
     
-    # Update aircraft parameters
-    performance_calc.set_aircraft_parameters(
-        wing_area=wing_area,
-        mass=aircraft_mass,
-        max_lift_coeff=max_lift_coeff,
-        zero_lift_drag=zero_lift_drag,
-        aspect_ratio=aspect_ratio
-    )
+    # Update aircraft parameters (a no-op when they did not change since the last rerun)
+    aircraft_params = {
+        'wing_area': wing_area,
+        'mass': aircraft_mass,
+        'max_lift_coeff': max_lift_coeff,
+        'zero_lift_drag': zero_lift_drag,
+        'aspect_ratio': aspect_ratio
+    }
+    performance_calc.set_aircraft_parameters(**aircraft_params)
+    
+    # Hashable form of the parameters, used as a cache key by the sweeps
+    params_key = tuple(sorted(aircraft_params.items()))
     
     # Main tabs
     tab1, tab2, tab3, tab4 = st.tabs([
@@ -76,23 +173,13 @@ def main():
         
         if st.button("Generate Atmosphere Profile"):
             with st.spinner("Calculating atmospheric properties..."):
-                profile = atm_model.generate_altitude_profile(max_altitude=max_alt*1000, step=step_size)
+                profile = compute_profile(max_alt*1000, step_size)
                 
                 # Create dataframe for display
-                df_profile = pd.DataFrame(profile)
-                df_display = df_profile[['altitude', 'temperature_c', 'pressure', 'density', 'speed_of_sound']].copy()
-                df_display.columns = ['Altitude (m)', 'Temperature (°C)', 'Pressure (Pa)', 'Density (kg/m³)', 'Speed of Sound (m/s)']
-                df_display['Altitude (km)'] = df_display['Altitude (m)'] / 1000
+                df_display = compute_profile_table(max_alt*1000, step_size)
                 
                 st.subheader("Atmospheric Properties Table")
-                st.dataframe(df_display.style.format({
-                    'Altitude (m)': '{:.0f}',
-                    'Altitude (km)': '{:.2f}',
-                    'Temperature (°C)': '{:.2f}',
-                    'Pressure (Pa)': '{:.2f}',
-                    'Density (kg/m³)': '{:.4f}',
-                    'Speed of Sound (m/s)': '{:.2f}'
-                }), height=400)
+                st.dataframe(df_display, column_config=PROFILE_COLUMN_CFG, height=400)
                 
                 # Plot atmospheric properties
                 st.subheader("Atmospheric Properties Visualization")
@@ -127,13 +214,13 @@ def main():
             
             with col2:
                 st.subheader("Aircraft Performance")
-                st.metric("Lift Coefficient", f"{perf_data['lift_coefficient']:.4f}")
-                st.metric("Drag Coefficient", f"{perf_data['drag_coefficient']:.4f}")
-                st.metric("Lift Force", f"{perf_data['lift_force']/1000:.2f} kN")
-                st.metric("Drag Force", f"{perf_data['drag_force']/1000:.2f} kN")
-                st.metric("Required Thrust", f"{perf_data['required_thrust']/1000:.2f} kN")
-                st.metric("Lift-to-Drag Ratio", f"{perf_data['lift_to_drag_ratio']:.2f}")
-                st.metric("Stall Speed", f"{perf_data['stall_speed']:.2f} m/s")
+                st.metric("Lift Coefficient", f"{perf_data.lift_coefficient:.4f}")
+                st.metric("Drag Coefficient", f"{perf_data.drag_coefficient:.4f}")
+                st.metric("Lift Force", f"{perf_data.lift_force/1000:.2f} kN")
+                st.metric("Drag Force", f"{perf_data.drag_force/1000:.2f} kN")
+                st.metric("Required Thrust", f"{perf_data.required_thrust/1000:.2f} kN")
+                st.metric("Lift-to-Drag Ratio", f"{perf_data.lift_to_drag_ratio:.2f}")
+                st.metric("Stall Speed", f"{perf_data.stall_speed:.2f} m/s")
     
     with tab3:
         st.markdown('<h2 class="section-header">Performance vs Altitude</h2>', 
@@ -151,34 +238,20 @@ def main():
         
         if st.button("Generate Performance Curves"):
             with st.spinner("Calculating performance across altitudes..."):
-                altitudes = np.arange(min_alt, max_alt + alt_step, alt_step)
-                performance_data = []
-                
-                for alt in altitudes:
-                    perf = performance_calc.performance_at_condition(alt, velocity_analysis)
-                    performance_data.append(perf)
-                
+                altitudes, df_perf = compute_performance_curve(
+                    params_key, min_alt, max_alt, alt_step, velocity_analysis
+                )
+
                 # Plot performance curves
-                fig_perf = visualizer.plot_performance_curves(performance_data, altitudes, velocity_analysis)
+                fig_perf = visualizer.plot_performance_curves(df_perf, altitudes, velocity_analysis)
                 st.pyplot(fig_perf)
-                
+
                 # Create performance table
-                df_perf = pd.DataFrame(performance_data)
                 df_perf['altitude'] = altitudes
                 df_perf['altitude_km'] = df_perf['altitude'] / 1000
                 
                 st.subheader("Performance Data Table")
-                st.dataframe(df_perf.style.format({
-                    'altitude': '{:.0f}',
-                    'altitude_km': '{:.2f}',
-                    'lift_coefficient': '{:.4f}',
-                    'drag_coefficient': '{:.4f}',
-                    'lift_force': '{:.2f}',
-                    'drag_force': '{:.2f}',
-                    'lift_to_drag_ratio': '{:.2f}',
-                    'required_thrust': '{:.2f}',
-                    'stall_speed': '{:.2f}'
-                }), height=400)
+                st.dataframe(df_perf, column_config=PERFORMANCE_COLUMN_CFG, height=400)
     
     with tab4:
         st.markdown('<h2 class="section-header">Thrust-Drag Analysis</h2>', 
@@ -196,39 +269,19 @@ def main():
         
         if st.button("Analyze Thrust-Drag Relationship"):
             with st.spinner("Calculating thrust-drag curves..."):
-                velocities = np.arange(min_vel, max_vel + vel_step, vel_step)
+                velocities, perf, df_thrust = compute_thrust_drag(
+                    params_key, analysis_altitude, min_vel, max_vel, vel_step
+                )
                 
-                # Plot thrust-drag curves
-                fig_td = visualizer.plot_thrust_drag_curves(performance_calc, analysis_altitude, velocities)
+                # Plot thrust-drag curves from the cached sweep
+                fig_td = visualizer.plot_thrust_drag_curves(
+                    performance_calc, analysis_altitude, velocities, perf=perf
+                )
                 st.pyplot(fig_td)
                 
                 # Create detailed table
-                thrust_data = []
-                for vel in velocities:
-                    atm_props = atm_model.get_atmospheric_properties(analysis_altitude)
-                    perf = performance_calc.performance_at_condition(analysis_altitude, vel)
-                    
-                    thrust_data.append({
-                        'velocity': vel,
-                        'mach_number': vel / atm_props['speed_of_sound'],
-                        'required_thrust_kN': perf['required_thrust'] / 1000,
-                        'drag_force_kN': perf['drag_force'] / 1000,
-                        'lift_coefficient': perf['lift_coefficient'],
-                        'drag_coefficient': perf['drag_coefficient'],
-                        'L_D_ratio': perf['lift_to_drag_ratio']
-                    })
-                
-                df_thrust = pd.DataFrame(thrust_data)
                 st.subheader("Thrust-Drag Analysis Data")
-                st.dataframe(df_thrust.style.format({
-                    'velocity': '{:.1f}',
-                    'mach_number': '{:.3f}',
-                    'required_thrust_kN': '{:.2f}',
-                    'drag_force_kN': '{:.2f}',
-                    'lift_coefficient': '{:.4f}',
-                    'drag_coefficient': '{:.4f}',
-                    'L_D_ratio': '{:.2f}'
-                }), height=400)
+                st.dataframe(df_thrust, column_config=THRUST_COLUMN_CFG, height=400)
 
     # Footer
     st.markdown("---")
@@ -16,10 +16,8 @@ __version__ = "1.0.0"
 __author__ = "Kumar Karan Bohidar"
 __email__ = "kumar.25bas10049@vitbhopal.ac.in"
 
-# Import key classes to make them available at package level
-from .atmosphere_model import StandardAtmosphere
-from .aircraft_performance import AircraftPerformance
-from .visualization import AtmosphereVisualizer
+import importlib
+
 from .utils import (
     load_aircraft_config,
     save_aircraft_config,
@@ -34,10 +32,33 @@ from .utils import (
     UnitConverter
 )
 
+# Key classes are imported on first access (PEP 562), so code that only
+# needs the utilities does not pay for matplotlib/streamlit imports
+_LAZY_IMPORTS = {
+    'StandardAtmosphere': '.atmosphere_model',
+    'TabulatedAtmosphere': '.atmosphere_model',
+    'AircraftPerformance': '.aircraft_performance',
+    'PerfResult': '.aircraft_performance',
+    'AtmosphereVisualizer': '.visualization',
+}
+
+def __getattr__(name):
+    """Import the lazily exported classes on first access."""
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 # Define what gets imported with "from src import *"
 __all__ = [
     'StandardAtmosphere',
+    'TabulatedAtmosphere',
     'AircraftPerformance', 
+    'PerfResult',
     'AtmosphereVisualizer',
     'load_aircraft_config',
     'save_aircraft_config',
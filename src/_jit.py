@@ -0,0 +1,20 @@
+"""
+Optional Numba support for the compiled kernels
+
+Compiled kernels are cached on disk (cache=True). The cache records the
+importing module's name, so the modules that use this shim import it
+relatively: they only load as part of the src package, which keeps a single
+import name (src.*) for every cached kernel.
+"""
+
+try:
+    from numba import njit, prange
+    _NUMBA_AVAILABLE = True
+except ImportError:  # Numba is optional; fall back to plain Python
+    _NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
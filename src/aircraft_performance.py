@@ -1,41 +1,175 @@
+import math
+import types
+from typing import NamedTuple
+
 import numpy as np
 
+from ._jit import njit
+
+_G = 9.81  # Gravitational acceleration [m/s²]
+_PI = math.pi
+
+# Aircraft parameters understood by AircraftPerformance
+_PARAM_NAMES = (
+    'wing_area', 'mass', 'max_lift_coeff',
+    'zero_lift_drag', 'oswald_efficiency', 'aspect_ratio'
+)
+
+# Descriptive configuration-file entries accepted by set_aircraft_parameters
+_CONFIG_METADATA_KEYS = frozenset({'name', 'description'})
+
+# Default aircraft parameters (Boeing 737-like)
+_DEFAULT_PARAMS = {
+    'wing_area': 125,  # m²
+    'mass': 70000,  # kg
+    'max_lift_coeff': 1.8,
+    'zero_lift_drag': 0.02,
+    'oswald_efficiency': 0.85,
+    'aspect_ratio': 9.5
+}
+
+
+class PerfResult(NamedTuple):
+    """
+    Performance metrics at one flight condition, in the order returned by _perf_kernel
+    Fields are read as attributes; perf['name'] is also accepted
+    """
+    lift_coefficient: float
+    drag_coefficient: float
+    lift_force: float
+    drag_force: float
+    lift_to_drag_ratio: float
+    required_thrust: float
+    stall_speed: float
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+
+# Keys of a performance result, in the order returned by _perf_kernel
+_RESULT_KEYS = PerfResult._fields
+
+
+@njit(fastmath=True, cache=True)
+def _perf_kernel(rho, V, weight, S, CD0, k, Vs_const):
+    """
+    Scalar performance kernel for a single flight condition
+    k is the induced-drag factor 1 / (π * AR * e) and Vs_const is
+    2 * W / (S * CL_max), so that V_stall = √(Vs_const / ρ)
+    Returns (CL, CD, lift, drag, L/D, required thrust, stall speed)
+    """
+    q_S = 0.5 * rho * V * V * S
+    CL = weight / q_S
+    CD = CD0 + CL * CL * k
+    L = q_S * CL
+    D = q_S * CD
+    L_D = CL / CD if CD > 0 else 0.0
+    V_stall = math.sqrt(Vs_const / rho)
+    return CL, CD, L, D, L_D, D, V_stall
+
+
+def _lift_to_drag(CL, CD):
+    """CL / CD element-wise, with 0 wherever CD <= 0"""
+    return np.divide(CL, CD, out=np.zeros(np.broadcast(CL, CD).shape), where=CD > 0)
+
+
+def _perf_arrays(rho, V, weight, S, CD0, k, Vs_const):
+    """
+    NumPy counterpart of _perf_kernel for broadcastable array arguments
+    Returns a dict keyed by the PerfResult field names, with every array
+    broadcast to the shape of the flight conditions. The stall speed is only
+    evaluated at the shape of its own inputs (once per altitude or aircraft)
+    and then broadcast
+    """
+    q_S = 0.5 * rho * V * V * S
+    CL = weight / q_S
+    CD = CD0 + CL * CL * k
+    D = q_S * CD
+    V_stall = np.broadcast_to(np.sqrt(Vs_const / rho), CL.shape).copy()
+    return dict(zip(_RESULT_KEYS, (
+        CL, CD, q_S * CL, D, _lift_to_drag(CL, CD), D.copy(), V_stall
+    )))
+
+
 class AircraftPerformance:
     """
     Calculate aircraft performance metrics using ISA model
     """
     
+    __slots__ = ('atm', '_induced_k', '_weight', '_Vs_const') + _PARAM_NAMES
+    
     def __init__(self, atmosphere_model):
         self.atm = atmosphere_model
-        
-        # Default aircraft parameters (Boeing 737-like)
-        self.default_params = {
-            'wing_area': 125,  # m²
-            'mass': 70000,  # kg
-            'max_lift_coeff': 1.8,
-            'zero_lift_drag': 0.02,
-            'oswald_efficiency': 0.85,
-            'aspect_ratio': 9.5
-        }
+        self._assign_parameters(_DEFAULT_PARAMS)
+    
+    def __setattr__(self, name, value):
+        """Assigning an aircraft parameter directly also refreshes the derived constants"""
+        object.__setattr__(self, name, value)
+        if name in _PARAM_NAMES:
+            self._update_derived()
+    
+    @property
+    def default_params(self):
+        """
+        Current aircraft parameters as a read-only mapping (a snapshot;
+        writing to it raises TypeError, use set_aircraft_parameters instead)
+        """
+        return types.MappingProxyType({name: getattr(self, name) for name in _PARAM_NAMES})
     
     def set_aircraft_parameters(self, **params):
-        """Update aircraft parameters"""
-        self.default_params.update(params)
+        """
+        Update aircraft parameters
+        The 'name' and 'description' entries of a configuration file are
+        accepted and ignored; any other unknown key raises TypeError. Calls
+        that do not change any parameter return without recomputing the
+        derived constants
+        """
+        unknown = params.keys() - _PARAM_NAMES - _CONFIG_METADATA_KEYS
+        if unknown:
+            raise TypeError(f"Unknown aircraft parameter(s): {', '.join(sorted(unknown))}")
+        changed = {
+            name: params[name] for name in _PARAM_NAMES
+            if name in params and params[name] != getattr(self, name)
+        }
+        if changed:
+            self._assign_parameters(changed)
+    
+    def _assign_parameters(self, params):
+        """Set several parameters, then recompute the derived constants once"""
+        for name, value in params.items():
+            object.__setattr__(self, name, value)
+        self._update_derived()
+    
+    def _update_derived(self):
+        """Recompute the constants derived from the aircraft parameters"""
+        self._induced_k = 1.0 / (_PI * self.aspect_ratio * self.oswald_efficiency)
+        self._weight = self.mass * _G
+        self._Vs_const = self._stall_constant(self._weight)
+    
+    def _weight_constants(self, mass=None):
+        """Weight and stall constant for the given mass (default: the aircraft's)"""
+        if mass is None:
+            return self._weight, self._Vs_const
+        weight = mass * _G
+        return weight, self._stall_constant(weight)
+    
+    def _stall_constant(self, weight):
+        """2 * W / (S * CL_max), so that V_stall = √(constant / ρ)"""
+        return 2 * weight / (self.wing_area * self.max_lift_coeff)
     
     def lift_coefficient(self, altitude, velocity, mass=None):
         """
         Calculate required lift coefficient
         L = 0.5 * ρ * V² * S * CL
         """
-        if mass is None:
-            mass = self.default_params['mass']
+        weight = self._weight if mass is None else mass * _G
         
         rho = self.atm.density(altitude)
-        S = self.default_params['wing_area']
-        g = 9.81  # m/s²
-        
-        weight = mass * g
-        CL = (2 * weight) / (rho * velocity**2 * S)
+        CL = (2 * weight) / (rho * velocity**2 * self.wing_area)
         return CL
     
     def drag_coefficient(self, CL):
@@ -43,73 +177,117 @@ class AircraftPerformance:
         Calculate drag coefficient using drag polar
         CD = CD0 + (CL² / (π * AR * e))
         """
-        CD0 = self.default_params['zero_lift_drag']
-        AR = self.default_params['aspect_ratio']
-        e = self.default_params['oswald_efficiency']
-        
-        CD = CD0 + (CL**2 / (np.pi * AR * e))
+        CD = self.zero_lift_drag + CL * CL * self._induced_k
         return CD
     
     def lift_force(self, altitude, velocity, CL):
         """Calculate lift force"""
         rho = self.atm.density(altitude)
-        S = self.default_params['wing_area']
-        L = 0.5 * rho * velocity**2 * S * CL
+        L = 0.5 * rho * velocity**2 * self.wing_area * CL
         return L
     
     def drag_force(self, altitude, velocity, CD):
         """Calculate drag force"""
         rho = self.atm.density(altitude)
-        S = self.default_params['wing_area']
-        D = 0.5 * rho * velocity**2 * S * CD
+        D = 0.5 * rho * velocity**2 * self.wing_area * CD
         return D
     
     def lift_to_drag_ratio(self, CL, CD):
-        """Calculate lift-to-drag ratio"""
-        return CL / CD if CD > 0 else 0
+        """
+        Calculate lift-to-drag ratio
+        Accepts scalars or arrays; entries with CD <= 0 give 0
+        """
+        return _lift_to_drag(np.asarray(CL, dtype=float), np.asarray(CD, dtype=float))[()]
     
     def required_thrust(self, altitude, velocity, mass=None):
         """
         Calculate required thrust for level flight
         Thrust = Drag in steady level flight
+        velocity may also be an array, giving one thrust per velocity
         """
-        CL = self.lift_coefficient(altitude, velocity, mass)
-        CD = self.drag_coefficient(CL)
-        return self.drag_force(altitude, velocity, CD)
+        if np.ndim(velocity):
+            return self.performance_at_condition_array(altitude, velocity, mass).required_thrust
+        rho = self.atm.density(altitude)
+        return self._compute(rho, velocity, mass)[5]
     
     def stall_speed(self, altitude, mass=None):
         """Calculate stall speed"""
-        if mass is None:
-            mass = self.default_params['mass']
+        Vs_const = self._Vs_const if mass is None else self._stall_constant(mass * _G)
         
         rho = self.atm.density(altitude)
-        S = self.default_params['wing_area']
-        CL_max = self.default_params['max_lift_coeff']
-        g = 9.81
-        
-        weight = mass * g
-        V_stall = np.sqrt((2 * weight) / (rho * S * CL_max))
+        V_stall = np.sqrt(Vs_const / rho)
         return V_stall
     
-    def performance_at_condition(self, altitude, velocity, mass=None):
-        """Calculate all performance metrics at given condition"""
-        if mass is None:
-            mass = self.default_params['mass']
-        
-        CL = self.lift_coefficient(altitude, velocity, mass)
-        CD = self.drag_coefficient(CL)
-        L = self.lift_force(altitude, velocity, CL)
-        D = self.drag_force(altitude, velocity, CD)
-        L_D = self.lift_to_drag_ratio(CL, CD)
-        thrust_required = self.required_thrust(altitude, velocity, mass)
-        stall_speed = self.stall_speed(altitude, mass)
+    def _compute(self, rho, velocity, mass=None):
+        """Run the performance kernel for an already known air density"""
+        weight, Vs_const = self._weight_constants(mass)
         
-        return {
-            'lift_coefficient': CL,
-            'drag_coefficient': CD,
-            'lift_force': L,
-            'drag_force': D,
-            'lift_to_drag_ratio': L_D,
-            'required_thrust': thrust_required,
-            'stall_speed': stall_speed
-        }
\ No newline at end of file
+        return _perf_kernel(
+            rho, velocity, weight, self.wing_area, self.zero_lift_drag,
+            self._induced_k, Vs_const
+        )
+    
+    def performance_at_condition(self, altitude, velocity, mass=None):
+        """Calculate all performance metrics at given condition as a PerfResult"""
+        rho = self.atm.density(altitude)
+        return PerfResult(*self._compute(rho, velocity, mass))
+
+    def performance_at_condition_array(self, altitude, velocities, mass=None):
+        """
+        Calculate all performance metrics at one altitude over a velocity sweep
+        The atmosphere is looked up once; returns a PerfResult of arrays with
+        one element per velocity
+        """
+        weight, Vs_const = self._weight_constants(mass)
+
+        rho = self.atm.density(altitude)
+        V = np.asarray(velocities, dtype=float)
+        return PerfResult(**_perf_arrays(
+            rho, V, weight, self.wing_area, self.zero_lift_drag, self._induced_k, Vs_const
+        ))
+
+    def performance_at_conditions(self, altitudes, velocities, mass=None):
+        """
+        Calculate all performance metrics over an altitude x velocity grid
+
+        Returns a dict keyed by the PerfResult field names, each
+        holding an array of shape (len(altitudes), len(velocities)).
+        """
+        weight, Vs_const = self._weight_constants(mass)
+
+        alt = np.atleast_1d(np.asarray(altitudes, dtype=float))
+        vel = np.atleast_1d(np.asarray(velocities, dtype=float))
+
+        # Density only depends on altitude, so evaluate it once per unique altitude
+        unique_alt, inverse = np.unique(alt, return_inverse=True)
+        unique_rho = self.atm.density_array(unique_alt)
+        rho_alt = unique_rho[inverse]
+
+        # One row per altitude and one column per velocity
+        return _perf_arrays(
+            rho_alt[:, None], vel[None, :], weight, self.wing_area,
+            self.zero_lift_drag, self._induced_k, Vs_const
+        )
+
+    def performance_for_aircraft(self, altitude, velocity, aircraft_params):
+        """
+        Calculate all performance metrics for several aircraft at one condition
+
+        aircraft_params maps parameter names to equal-length sequences, one
+        entry per aircraft; parameters that are left out use this instance's
+        values. Returns a dict keyed by the PerfResult field names, each
+        holding an array with one value per aircraft.
+        """
+        params = {
+            name: np.asarray(aircraft_params.get(name, getattr(self, name)), dtype=float)
+            for name in _PARAM_NAMES
+        }
+        S = params['wing_area']
+        weight = params['mass'] * _G
+        k = 1.0 / (_PI * params['aspect_ratio'] * params['oswald_efficiency'])
+        Vs_const = 2 * weight / (S * params['max_lift_coeff'])
+
+        return _perf_arrays(
+            self.atm.density(altitude), velocity, weight, S,
+            params['zero_lift_drag'], k, Vs_const
+        )
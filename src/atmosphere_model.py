@@ -1,5 +1,70 @@
+import functools
+import math
+
 import numpy as np
-from scipy.interpolate import interp1d
+
+from ._jit import _NUMBA_AVAILABLE, njit, prange
+
+
+def _isa_tpd(h, T0, P0, R, exp_tropo, exp_strat1, exp_strat2,
+             rate_tropopause, rate_stratopause, P11, P20, P32, P47):
+    """
+    ISA temperature, pressure and density at one altitude
+    The layer constants are precomputed by StandardAtmosphere and passed in,
+    so the function stays pure. Scalar queries call it as plain Python (their
+    results are memoised anyway); the array kernel uses a compiled copy.
+    Returns (T, P, rho)
+    """
+    if h <= 11000:  # Troposphere
+        T = T0 - 0.0065 * h
+        P = P0 * math.pow(T / T0, exp_tropo)
+    elif h <= 20000:  # Tropopause
+        T = 216.65
+        P = P11 * math.exp(rate_tropopause * (h - 11000))
+    elif h <= 32000:  # Stratosphere 1
+        T = 216.65 + 0.001 * (h - 20000)
+        P = P20 * math.pow(T / 216.65, exp_strat1)
+    elif h <= 47000:  # Stratosphere 2
+        T = 228.65 + 0.0028 * (h - 32000)
+        P = P32 * math.pow(T / 228.65, exp_strat2)
+    else:  # Stratopause and above
+        T = 270.65
+        P = P47 * math.exp(rate_stratopause * (h - 47000))
+    return T, P, P / (R * T)
+
+
+_isa_tpd_jit = njit(fastmath=True, cache=True)(_isa_tpd)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _isa_tpd_arr(h, T0, P0, R, exp_tropo, exp_strat1, exp_strat2,
+                 rate_tropopause, rate_stratopause, P11, P20, P32, P47,
+                 T_out, P_out, rho_out):
+    """Parallel _isa_tpd over an altitude array, filling the output arrays"""
+    for i in prange(h.shape[0]):
+        T_out[i], P_out[i], rho_out[i] = _isa_tpd_jit(
+            h[i], T0, P0, R, exp_tropo, exp_strat1, exp_strat2,
+            rate_tropopause, rate_stratopause, P11, P20, P32, P47
+        )
+
+
+# Scalar queries are memoised per altitude: the app and the tests ask for the
+# same few altitudes again and again, and every property of an altitude comes
+# from the same fused evaluation. The cache is keyed on the model constants
+# rather than held per instance, so it keeps no reference to the models
+@functools.lru_cache(maxsize=4096)
+def _cached_tpra(isa_args, gamma_R, altitude):
+    """(T, P, rho, a) at one altitude; T is reused for ρ and a"""
+    T, P, rho = _isa_tpd(altitude, *isa_args)
+    return T, P, rho, math.sqrt(gamma_R * T)
+
+
+# Keys of get_atmospheric_properties and generate_altitude_profile, in order
+_PROFILE_KEYS = (
+    'altitude', 'temperature', 'temperature_c', 'pressure',
+    'pressure_ratio', 'density', 'density_ratio', 'speed_of_sound'
+)
+
 
 class StandardAtmosphere:
     """
@@ -14,6 +79,7 @@ class StandardAtmosphere:
         self.T0 = 288.15  # Sea level temperature [K]
         self.P0 = 101325  # Sea level pressure [Pa]
         self.rho0 = 1.225  # Sea level density [kg/m³]
+        self.gamma = 1.4  # Ratio of specific heats for air
         
         # Layer boundaries (geopotential altitude in meters)
         self.layers = {
@@ -24,71 +90,82 @@ class StandardAtmosphere:
             'stratopause': (47000, 51000)
         }
         
+        # Per-layer pressure exponents: power laws in the gradient layers and
+        # exponential decay rates (per metre) in the isothermal layers
+        self._exp_tropo = self.g0 / (0.0065 * self.R)
+        self._exp_strat1 = -self.g0 / (0.001 * self.R)
+        self._exp_strat2 = -self.g0 / (0.0028 * self.R)
+        self._rate_tropopause = -self.g0 / (self.R * 216.65)
+        self._rate_stratopause = -self.g0 / (self.R * 270.65)
+        
+        # Pressure at the base of each upper layer; these are fixed by the
+        # constants above, so compute them once instead of recursing per call
+        self._P11 = self.P0 * math.pow(216.65 / self.T0, self._exp_tropo)
+        self._P20 = self._P11 * math.exp(self._rate_tropopause * (20000 - 11000))
+        self._P32 = self._P20 * math.pow(228.65 / 216.65, self._exp_strat1)
+        self._P47 = self._P32 * math.pow(270.65 / 228.65, self._exp_strat2)
+        
+        self._gamma_R = self.gamma * self.R  # a = √(γ R T)
+        
+        # Per-layer constants for the array methods, indexed by layer number
+        # (troposphere, tropopause, stratosphere 1, stratosphere 2, stratopause).
+        # Within layer i: T = T_base + lapse * (h - h_ref) and
+        # P = P_ref * (T / T_base) ** P_exp * exp(P_rate * (h - h_ref)), where
+        # isothermal layers have P_exp = 0 and gradient layers have P_rate = 0
+        self._layer_tops = np.array([11000.0, 20000.0, 32000.0, 47000.0])
+        self._h_ref = np.array([0.0, 11000.0, 20000.0, 32000.0, 47000.0])
+        self._T_base = np.array([self.T0, 216.65, 216.65, 228.65, 270.65])
+        self._lapse = np.array([-0.0065, 0.0, 0.001, 0.0028, 0.0])
+        self._P_ref = np.array([self.P0, self._P11, self._P20, self._P32, self._P47])
+        self._P_exp = np.array([self._exp_tropo, 0.0, self._exp_strat1, self._exp_strat2, 0.0])
+        self._P_rate = np.array([0.0, self._rate_tropopause, 0.0, 0.0, self._rate_stratopause])
+        
+        # Arguments for _isa_tpd and the array kernel, after the altitude
+        self._isa_args = (
+            self.T0, self.P0, self.R,
+            self._exp_tropo, self._exp_strat1, self._exp_strat2,
+            self._rate_tropopause, self._rate_stratopause,
+            self._P11, self._P20, self._P32, self._P47
+        )
+    
+    def _tpra(self, altitude):
+        """
+        Temperature, pressure, density and speed of sound at one altitude
+        The altitude is converted to float first, so any real scalar
+        (including a 0-d array) is accepted as a cache key
+        """
+        return _cached_tpra(self._isa_args, self._gamma_R, float(altitude))
+        
     def temperature(self, altitude):
         """
         Calculate temperature at given altitude using ISA model
+        Above 47 km the stratopause temperature is held constant
         """
-        h = altitude
-        
-        if h <= 11000:  # Troposphere
-            return self.T0 - 0.0065 * h
-        elif h <= 20000:  # Tropopause
-            return 216.65
-        elif h <= 32000:  # Stratosphere 1
-            return 216.65 + 0.001 * (h - 20000)
-        elif h <= 47000:  # Stratosphere 2
-            return 228.65 + 0.0028 * (h - 32000)
-        elif h <= 51000:  # Stratopause
-            return 270.65
-        else:
-            return 270.65  # Simplified for higher altitudes
+        return self._tpra(altitude)[0]
     
     def pressure(self, altitude):
         """
         Calculate pressure at given altitude using ISA model
         """
-        h = altitude
-        T = self.temperature(h)
-        
-        if h <= 11000:  # Troposphere
-            return self.P0 * (T / self.T0) ** (self.g0 / (0.0065 * self.R))
-        elif h <= 20000:  # Tropopause
-            P11 = self.pressure(11000)
-            return P11 * np.exp(-self.g0 * (h - 11000) / (self.R * 216.65))
-        elif h <= 32000:  # Stratosphere 1
-            P20 = self.pressure(20000)
-            return P20 * (T / 216.65) ** (-self.g0 / (0.001 * self.R))
-        elif h <= 47000:  # Stratosphere 2
-            P32 = self.pressure(32000)
-            return P32 * (T / 228.65) ** (-self.g0 / (0.0028 * self.R))
-        else:  # Stratopause and above
-            P47 = self.pressure(47000)
-            return P47 * np.exp(-self.g0 * (h - 47000) / (self.R * 270.65))
+        return self._tpra(altitude)[1]
     
     def density(self, altitude):
         """
         Calculate air density at given altitude
         """
-        T = self.temperature(altitude)
-        P = self.pressure(altitude)
-        return P / (self.R * T)
+        return self._tpra(altitude)[2]
     
     def speed_of_sound(self, altitude):
         """
         Calculate speed of sound at given altitude
         """
-        T = self.temperature(altitude)
-        gamma = 1.4  # Ratio of specific heats for air
-        return np.sqrt(gamma * self.R * T)
+        return self._tpra(altitude)[3]
     
     def get_atmospheric_properties(self, altitude):
         """
         Get all atmospheric properties at specified altitude
         """
-        T = self.temperature(altitude)
-        P = self.pressure(altitude)
-        rho = self.density(altitude)
-        a = self.speed_of_sound(altitude)
+        T, P, rho, a = self._tpra(altitude)
         
         return {
             'altitude': altitude,
@@ -101,15 +178,200 @@ class StandardAtmosphere:
             'speed_of_sound': a
         }
     
-    def generate_altitude_profile(self, max_altitude=50000, step=100):
+    def _layer_index(self, h):
+        """
+        Layer number of each altitude (0 = troposphere ... 4 = stratopause)
+        A layer includes its upper boundary, as in the scalar model
+        """
+        return np.searchsorted(self._layer_tops, h, side='left')
+    
+    def _tp_array(self, h):
+        """
+        Temperature and pressure over an altitude array, sharing the layer
+        lookup and working in preallocated buffers rather than temporaries
+        """
+        shape = h.shape
+        h = h.reshape(-1)
+        idx = self._layer_index(h)
+        dh = np.subtract(h, self._h_ref[idx])
+        T_base = self._T_base[idx]
+        
+        T = self._lapse[idx]
+        np.multiply(T, dh, out=T)
+        np.add(T, T_base, out=T)
+        
+        P = np.divide(T, T_base, out=T_base)  # T / T_base, reusing its buffer
+        np.power(P, self._P_exp[idx], out=P)
+        decay = self._P_rate[idx]
+        np.multiply(decay, dh, out=decay)
+        np.exp(decay, out=decay)
+        np.multiply(P, decay, out=P)
+        np.multiply(P, self._P_ref[idx], out=P)
+        return T.reshape(shape), P.reshape(shape)
+    
+    def temperature_array(self, altitudes):
+        """
+        Calculate temperature over an array of altitudes in one vectorized pass
+        """
+        h = np.asarray(altitudes, dtype=float)
+        idx = self._layer_index(h)
+        return self._T_base[idx] + self._lapse[idx] * (h - self._h_ref[idx])
+    
+    def pressure_array(self, altitudes):
+        """
+        Calculate pressure over an array of altitudes in one vectorized pass
+        Each altitude evaluates only its own layer's formula
+        """
+        return self._tp_array(np.asarray(altitudes, dtype=float))[1]
+    
+    def density_array(self, altitudes):
+        """
+        Calculate air density over an array of altitudes in one vectorized pass
+        """
+        return self._tpd_array(altitudes)[2]
+    
+    def _tpd_array(self, altitudes):
+        """
+        Temperature, pressure and density over an array of altitudes
+        Uses the parallel Numba kernel when available
+        """
+        # Work on a flat contiguous array; the results take the input's shape
+        h = np.asarray(altitudes, dtype=float)
+        flat = np.ascontiguousarray(h.reshape(-1))
+        if _NUMBA_AVAILABLE:
+            T, P, rho = np.empty_like(flat), np.empty_like(flat), np.empty_like(flat)
+            _isa_tpd_arr(flat, *self._isa_args, T, P, rho)
+        else:
+            T, P = self._tp_array(flat)
+            rho = np.multiply(T, self.R)
+            np.divide(P, rho, out=rho)
+        return T.reshape(h.shape), P.reshape(h.shape), rho.reshape(h.shape)
+    
+    def generate_altitude_profile(self, max_altitude=50000, step=100, dtype=np.float64):
         """
         Generate atmospheric profile from sea level to max_altitude
+        Returns a dict of contiguous arrays with the same keys as
+        get_atmospheric_properties, one element per altitude
+        (use _aos_view for per-altitude dicts). The properties are computed
+        in double precision; dtype=np.float32 halves the size of the returned
+        arrays, which is plenty for plotting and display
         """
-        altitudes = np.arange(0, max_altitude + step, step)
-        profile = []
+        altitudes = np.arange(0, max_altitude + step, step, dtype=float)
+        T, P, rho = self._tpd_array(altitudes)
         
-        for alt in altitudes:
-            props = self.get_atmospheric_properties(alt)
-            profile.append(props)
+        # One contiguous block holds every column; each property is written
+        # straight into its row (converting to dtype on the way)
+        block = np.empty((len(_PROFILE_KEYS), altitudes.size), dtype=dtype)
+        alt_row, T_row, T_c_row, P_row, P_ratio_row, rho_row, rho_ratio_row, a_row = block
+        alt_row[:] = altitudes
+        T_row[:] = T
+        np.subtract(T, 273.15, out=T_c_row)
+        P_row[:] = P
+        np.divide(P, self.P0, out=P_ratio_row)
+        rho_row[:] = rho
+        np.divide(rho, self.rho0, out=rho_ratio_row)
+        np.multiply(T, self._gamma_R, out=T)
+        np.sqrt(T, out=a_row)
+        return dict(zip(_PROFILE_KEYS, block))
+
+
+def _aos_view(profile):
+    """
+    Iterate over a profile from generate_altitude_profile one altitude at a
+    time, yielding dicts like get_atmospheric_properties returns
+    """
+    keys = list(profile)
+    for row in zip(*(profile[key].tolist() for key in keys)):
+        yield dict(zip(keys, row))
+
+
+@functools.lru_cache(maxsize=None)
+def _isa_table(max_altitude, points):
+    """
+    Tabulate exact ISA properties on a uniform altitude grid
+    Built once per process and shared by every TabulatedAtmosphere
+    """
+    atm = StandardAtmosphere()
+    h = np.linspace(0, max_altitude, points)
+    T = atm.temperature_array(h)
+    P = atm.pressure_array(h)
+    table = (h, T, P, P / (atm.R * T), np.sqrt(atm.gamma * atm.R * T))
+    for arr in table:
+        arr.flags.writeable = False
+    return table
+
+
+@functools.lru_cache(maxsize=None)
+def _isa_table_values(max_altitude, points):
+    """
+    The tabulated T, P, ρ and a as tuples of Python floats
+    Scalar lookups index these directly, avoiding NumPy scalar overhead
+    """
+    return tuple(tuple(arr.tolist()) for arr in _isa_table(max_altitude, points)[1:])
+
+
+class TabulatedAtmosphere(StandardAtmosphere):
+    """
+    ISA model backed by a precomputed lookup table
+    Properties are linearly interpolated on a uniform grid (5 m spacing by
+    default). Scalar altitudes find their table cell by index arithmetic on
+    the fixed step, with no search or layer branching; altitude arrays go
+    through np.interp. Altitudes outside the table are clamped.
+    """
+    
+    def __init__(self, max_altitude=50000, points=10001):
+        super().__init__()
+        (self._h_table, self._T_table, self._P_table,
+         self._rho_table, self._a_table) = _isa_table(max_altitude, points)
+        (self._T_values, self._P_values,
+         self._rho_values, self._a_values) = _isa_table_values(max_altitude, points)
+        self._dh_inv = (points - 1) / max_altitude
+        self._last_index = points - 1
+    
+    def _tpra(self, altitude):
+        # Lookups are already cheap and also accept arrays, so skip the memo
+        return (self.temperature(altitude), self.pressure(altitude),
+                self.density(altitude), self.speed_of_sound(altitude))
+    
+    def _lookup(self, altitude, table, values):
+        """Linearly interpolate one tabulated property at the given altitude(s)"""
+        if not isinstance(altitude, (int, float)):
+            return np.interp(altitude, self._h_table, table)
         
-        return profile
\ No newline at end of file
+        x = altitude * self._dh_inv
+        if x <= 0:
+            return values[0]
+        if x >= self._last_index:
+            return values[-1]
+        idx = int(x)
+        lower = values[idx]
+        return lower + (x - idx) * (values[idx + 1] - lower)
+    
+    def temperature(self, altitude):
+        """Interpolate temperature from the lookup table"""
+        return self._lookup(altitude, self._T_table, self._T_values)
+    
+    def pressure(self, altitude):
+        """Interpolate pressure from the lookup table"""
+        return self._lookup(altitude, self._P_table, self._P_values)
+    
+    def density(self, altitude):
+        """Interpolate air density from the lookup table"""
+        return self._lookup(altitude, self._rho_table, self._rho_values)
+    
+    def speed_of_sound(self, altitude):
+        """Interpolate speed of sound from the lookup table"""
+        return self._lookup(altitude, self._a_table, self._a_values)
+    
+    def _tpd_array(self, altitudes):
+        return (self.temperature_array(altitudes), self.pressure_array(altitudes),
+                self.density_array(altitudes))
+    
+    def temperature_array(self, altitudes):
+        return np.interp(altitudes, self._h_table, self._T_table)
+    
+    def pressure_array(self, altitudes):
+        return np.interp(altitudes, self._h_table, self._P_table)
+    
+    def density_array(self, altitudes):
+        return np.interp(altitudes, self._h_table, self._rho_table)
@@ -3,27 +3,48 @@ Utility functions for the Standard Atmosphere Analyzer
 """
 
 import json
-import numpy as np
-from typing import Dict, Any, List
+from typing import Dict, Any, List, IO, Union
 
-def load_aircraft_config(filepath: str) -> Dict[str, Any]:
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; the standard library parser works too
+    _json_loads = json.loads
+
+# Conversion factors, with reciprocals precomputed so every conversion is a
+# single multiplication. The helpers below work element-wise on NumPy arrays
+# as well as on scalars, so whole profiles can be converted in one call.
+_FT_PER_M = 3.28084
+_M_PER_FT = 1.0 / _FT_PER_M
+_KT_PER_MPS = 1.94384
+_MPS_PER_KT = 1.0 / _KT_PER_MPS
+_INHG_PER_PA = 1.0 / 3386.389
+_PSI_PER_PA = 1.0 / 6894.76
+_LBF_PER_N = 1.0 / 4.44822
+
+def load_aircraft_config(filepath: Union[str, IO]) -> Dict[str, Any]:
     """
     Load aircraft configuration from JSON file
     
     Args:
-        filepath: Path to JSON configuration file
+        filepath: Path to JSON configuration file, or an open file-like
+            object (text or binary) to read the configuration from
         
     Returns:
         Dictionary containing aircraft parameters
     """
     try:
-        with open(filepath, 'r') as f:
-            config = json.load(f)
-        return config
+        if hasattr(filepath, 'read'):
+            data = filepath.read()
+        else:
+            with open(filepath, 'rb') as f:
+                data = f.read()
+        return _json_loads(data)
     except FileNotFoundError:
         raise FileNotFoundError(f"Aircraft configuration file not found: {filepath}")
     except json.JSONDecodeError:
-        raise ValueError(f"Invalid JSON in configuration file: {filepath}")
+        name = getattr(filepath, 'name', filepath)
+        raise ValueError(f"Invalid JSON in configuration file: {name}")
 
 def save_aircraft_config(config: Dict[str, Any], filepath: str):
     """
@@ -41,40 +62,40 @@ def validate_altitude(altitude: float) -> bool:
     Validate that altitude is within reasonable bounds
     
     Args:
-        altitude: Altitude in meters
+        altitude: Altitude in meters, or an array of altitudes
         
     Returns:
-        True if valid, False otherwise
+        True if valid, False otherwise (a boolean array for array input)
     """
-    return 0 <= altitude <= 50000
+    return (altitude >= 0) & (altitude <= 50000)
 
 def validate_velocity(velocity: float) -> bool:
     """
     Validate that velocity is within reasonable bounds
     
     Args:
-        velocity: Velocity in m/s
+        velocity: Velocity in m/s, or an array of velocities
         
     Returns:
-        True if valid, False otherwise
+        True if valid, False otherwise (a boolean array for array input)
     """
-    return 0 < velocity <= 1000
+    return (velocity > 0) & (velocity <= 1000)
 
 def meters_to_feet(meters: float) -> float:
     """Convert meters to feet"""
-    return meters * 3.28084
+    return meters * _FT_PER_M
 
 def feet_to_meters(feet: float) -> float:
     """Convert feet to meters"""
-    return feet / 3.28084
+    return feet * _M_PER_FT
 
 def mps_to_knots(mps: float) -> float:
     """Convert meters per second to knots"""
-    return mps * 1.94384
+    return mps * _KT_PER_MPS
 
 def knots_to_mps(knots: float) -> float:
     """Convert knots to meters per second"""
-    return knots / 1.94384
+    return knots * _MPS_PER_KT
 
 def calculate_mach_number(velocity: float, speed_of_sound: float) -> float:
     """
@@ -108,19 +129,19 @@ class UnitConverter:
     @staticmethod
     def pressure_pa_to_inhg(pa: float) -> float:
         """Convert Pascals to inches of mercury"""
-        return pa / 3386.389
+        return pa * _INHG_PER_PA
     
     @staticmethod
     def pressure_pa_to_psi(pa: float) -> float:
         """Convert Pascals to PSI"""
-        return pa / 6894.76
+        return pa * _PSI_PER_PA
     
     @staticmethod
     def temperature_c_to_f(celsius: float) -> float:
         """Convert Celsius to Fahrenheit"""
-        return celsius * 9/5 + 32
+        return celsius * 1.8 + 32
     
     @staticmethod
     def force_n_to_lbf(newtons: float) -> float:
         """Convert Newtons to pound-force"""
-        return newtons / 4.44822
+        return newtons * _LBF_PER_N
@@ -1,23 +1,73 @@
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.ticker import ScalarFormatter
-import streamlit as st
+
+def _columns(data, keys):
+    """
+    Extract columns as a dict of arrays from column-oriented data (a dict of
+    arrays or a DataFrame) or from a list of per-point dicts, which is read
+    in a single pass into a structured array
+    """
+    if isinstance(data, (list, tuple)):
+        rows = np.fromiter(
+            (tuple(p[key] for key in keys) for p in data),
+            dtype=[(key, np.float64) for key in keys],
+            count=len(data)
+        )
+        return {key: rows[key] for key in keys}
+    return {key: np.asarray(data[key]) for key in keys}
+
+_STYLE_APPLIED = False
+
+def _apply_style():
+    """Apply the plot style once per process; plt.style.use resets rcParams"""
+    global _STYLE_APPLIED
+    if not _STYLE_APPLIED:
+        plt.style.use('seaborn-v0_8')
+        _STYLE_APPLIED = True
 
 class AtmosphereVisualizer:
     """Create professional plots for atmospheric and performance data"""
     
-    def __init__(self):
-        plt.style.use('seaborn-v0_8')
+    def __init__(self, dpi=None, reuse_figures=False):
+        """
+        With reuse_figures=True each plot method keeps one figure and redraws
+        it on later calls instead of allocating a new one (useful for
+        interactive apps that re-render the same plots repeatedly)
+        """
+        _apply_style()
         self.fig_size = (10, 6)
+        self.dpi = dpi  # None uses matplotlib's default
+        self._figures = {} if reuse_figures else None
     
-    def plot_atmospheric_properties(self, profile):
-        """Plot atmospheric properties vs altitude"""
-        altitudes = [p['altitude'] / 1000 for p in profile]  # Convert to km
-        temperatures = [p['temperature_c'] for p in profile]
-        pressures = [p['pressure'] / 1000 for p in profile]  # Convert to kPa
-        densities = [p['density'] for p in profile]
-        
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 10))
+    def _subplots(self, nrows, ncols, figsize, fig=None, kind=None):
+        """
+        Create a grid of axes, clearing and reusing fig when one is given
+        Without fig, figure reuse hands back the figure last used for this kind of plot
+        """
+        if fig is None and self._figures is not None:
+            fig = self._figures.get(kind)
+        if fig is None:
+            fig, axes = plt.subplots(nrows, ncols, figsize=figsize, dpi=self.dpi)
+            if self._figures is not None:
+                self._figures[kind] = fig
+            return fig, axes
+        fig.clear()
+        return fig, fig.subplots(nrows, ncols)
+    
+    def plot_atmospheric_properties(self, profile, fig=None):
+        """
+        Plot atmospheric properties vs altitude
+        profile is a dict of arrays as returned by generate_altitude_profile;
+        a list of per-altitude dicts is also accepted
+        """
+        columns = _columns(profile, ('altitude', 'temperature_c', 'pressure', 'density'))
+        altitudes = columns['altitude'] / 1000  # Convert to km
+        temperatures = columns['temperature_c']
+        pressures = columns['pressure'] / 1000  # Convert to kPa
+        densities = columns['density']
+        
+        fig, ((ax1, ax2), (ax3, ax4)) = self._subplots(2, 2, (12, 10), fig, 'atmosphere')
         
         # Temperature plot
         ax1.plot(temperatures, altitudes, 'r-', linewidth=2)
@@ -57,17 +107,25 @@ class AtmosphereVisualizer:
         ax4.grid(True, alpha=0.3)
         ax4_twin.set_yscale('linear')
         
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
     
-    def plot_performance_curves(self, performance_data, altitudes, velocity):
-        """Plot aircraft performance curves"""
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(12, 10))
+    def plot_performance_curves(self, performance_data, altitudes, velocity, fig=None):
+        """
+        Plot aircraft performance curves
+        performance_data is column-oriented (dict of arrays or DataFrame);
+        a list of per-altitude dicts is also accepted
+        """
+        fig, ((ax1, ax2), (ax3, ax4)) = self._subplots(2, 2, (12, 10), fig, 'performance')
+        columns = _columns(performance_data, (
+            'lift_force', 'drag_force', 'required_thrust', 'lift_to_drag_ratio',
+            'lift_coefficient', 'drag_coefficient', 'stall_speed'
+        ))
         
         # Lift and Drag vs Altitude
-        lift_forces = [p['lift_force'] / 1000 for p in performance_data]  # kN
-        drag_forces = [p['drag_force'] / 1000 for p in performance_data]  # kN
-        thrust_required = [p['required_thrust'] / 1000 for p in performance_data]  # kN
+        lift_forces = columns['lift_force'] / 1000  # kN
+        drag_forces = columns['drag_force'] / 1000  # kN
+        thrust_required = columns['required_thrust'] / 1000  # kN
         
         ax1.plot(altitudes, lift_forces, 'g-', label='Lift Force', linewidth=2)
         ax1.plot(altitudes, drag_forces, 'r-', label='Drag Force', linewidth=2)
@@ -79,7 +137,7 @@ class AtmosphereVisualizer:
         ax1.grid(True, alpha=0.3)
         
         # Lift-to-Drag Ratio vs Altitude
-        L_D_ratios = [p['lift_to_drag_ratio'] for p in performance_data]
+        L_D_ratios = columns['lift_to_drag_ratio']
         ax2.plot(altitudes, L_D_ratios, 'purple', linewidth=2)
         ax2.set_xlabel('Altitude (m)')
         ax2.set_ylabel('L/D Ratio')
@@ -87,8 +145,8 @@ class AtmosphereVisualizer:
         ax2.grid(True, alpha=0.3)
         
         # Coefficients vs Altitude
-        CL_values = [p['lift_coefficient'] for p in performance_data]
-        CD_values = [p['drag_coefficient'] for p in performance_data]
+        CL_values = columns['lift_coefficient']
+        CD_values = columns['drag_coefficient']
         
         ax3.plot(altitudes, CL_values, 'orange', label='Lift Coefficient (CL)', linewidth=2)
         ax3.plot(altitudes, CD_values, 'brown', label='Drag Coefficient (CD)', linewidth=2)
@@ -99,29 +157,29 @@ class AtmosphereVisualizer:
         ax3.grid(True, alpha=0.3)
         
         # Stall Speed vs Altitude
-        stall_speeds = [p['stall_speed'] for p in performance_data]
+        stall_speeds = columns['stall_speed']
         ax4.plot(altitudes, stall_speeds, 'red', linewidth=2)
         ax4.set_xlabel('Altitude (m)')
         ax4.set_ylabel('Stall Speed (m/s)')
         ax4.set_title('Stall Speed vs Altitude')
         ax4.grid(True, alpha=0.3)
         
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
     
-    def plot_thrust_drag_curves(self, performance_calc, altitude, velocities):
-        """Plot thrust vs drag curves"""
-        thrust_values = []
-        drag_values = []
-        L_D_ratios = []
-        
-        for vel in velocities:
-            perf = performance_calc.performance_at_condition(altitude, vel)
-            thrust_values.append(perf['required_thrust'] / 1000)  # kN
-            drag_values.append(perf['drag_force'] / 1000)  # kN
-            L_D_ratios.append(perf['lift_to_drag_ratio'])
-        
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(12, 5))
+    def plot_thrust_drag_curves(self, performance_calc, altitude, velocities, fig=None, perf=None):
+        """
+        Plot thrust vs drag curves
+        perf may hold an already computed performance_at_condition_array
+        result for these velocities, in which case it is plotted directly
+        """
+        if perf is None:
+            perf = performance_calc.performance_at_condition_array(altitude, velocities)
+        thrust_values = perf.required_thrust / 1000  # kN
+        drag_values = perf.drag_force / 1000  # kN
+        L_D_ratios = perf.lift_to_drag_ratio
+        
+        fig, (ax1, ax2) = self._subplots(1, 2, (12, 5), fig, 'thrust_drag')
         
         # Thrust vs Drag
         ax1.plot(velocities, thrust_values, 'b-', label='Required Thrust', linewidth=2)
@@ -139,5 +197,5 @@ class AtmosphereVisualizer:
         ax2.set_title(f'Lift-to-Drag Ratio vs Velocity (Altitude: {altitude} m)')
         ax2.grid(True, alpha=0.3)
         
-        plt.tight_layout()
+        fig.tight_layout()
         return fig
\ No newline at end of file
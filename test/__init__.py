@@ -10,10 +10,12 @@ This package contains unit tests for:
 Run tests with: python -m pytest tests/
 """
 
+import importlib
 import os
 import sys
 
-# Add the src directory to Python path for testing
+# Add the repository root to the Python path, so the tests import the
+# package as src (its modules only load under that name)
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 # Test configuration
@@ -23,11 +25,22 @@ TEST_CONFIG = {
     'tolerance': 1e-6  # For floating point comparisons
 }
 
-# Import test modules to make them discoverable
-from .test_atmosphere import TestStandardAtmosphere
-from .test_performance import TestAircraftPerformance
-from .test_visualization import TestVisualization
-from .test_utils import TestUtils
+# Test classes are imported on first access (PEP 562), so collecting one
+# test module does not import the others and their heavy dependencies
+_LAZY_IMPORTS = {
+    'TestStandardAtmosphere': '.test_atmosphere',
+    'TestAircraftPerformance': '.test_performance',
+    'TestVisualization': '.test_visualization',
+    'TestUtils': '.test_utils',
+}
+
+def __getattr__(name):
+    """Import the lazily exported test classes on first access."""
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'TestStandardAtmosphere',
@@ -0,0 +1,53 @@
+"""
+Shared pytest fixtures for the Standard Atmosphere Analyzer test suite
+"""
+
+import sys
+import os
+import pytest
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Select the non-interactive backend before anything imports pyplot, so no
+# GUI toolkit is probed; the environment variable carries over to xdist workers
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+# The models are imported inside the fixtures, so collection and runs that
+# select only non-model tests (e.g. with -k) skip the model and matplotlib imports
+
+def _read_only(profile):
+    """Lock the profile arrays, so no test can alter the data the others share"""
+    for values in profile.values():
+        values.setflags(write=False)
+    return profile
+
+@pytest.fixture(scope="session")
+def atm():
+    from src.atmosphere_model import StandardAtmosphere
+    return StandardAtmosphere()
+
+@pytest.fixture(scope="session")
+def performance(atm):
+    from src.aircraft_performance import AircraftPerformance
+    return AircraftPerformance(atm)
+
+@pytest.fixture(scope="session")
+def visualizer():
+    from src.visualization import AtmosphereVisualizer
+    return AtmosphereVisualizer()
+
+@pytest.fixture(scope="session")
+def profile(atm):
+    return _read_only(atm.generate_altitude_profile(max_altitude=10000, step=2000))
+
+@pytest.fixture(scope="session")
+def full_profile(atm):
+    return _read_only(atm.generate_altitude_profile(max_altitude=50000, step=100))
+
+@pytest.fixture(scope="session")
+def altitudes():
+    return (0, 5000, 10000)
+
+@pytest.fixture(scope="session")
+def performance_data(performance, altitudes):
+    # A tuple of PerfResults, so no test can alter the data the others share
+    return tuple(performance.performance_at_condition(alt, 250) for alt in altitudes)
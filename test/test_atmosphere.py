@@ -8,12 +8,13 @@ import unittest
 import numpy as np
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from src.atmosphere_model import StandardAtmosphere
+from src.atmosphere_model import StandardAtmosphere, TabulatedAtmosphere, _aos_view
 
 class TestStandardAtmosphere(unittest.TestCase):
     
-    def setUp(self):
-        self.atm = StandardAtmosphere()
+    @classmethod
+    def setUpClass(cls):
+        cls.atm = StandardAtmosphere()
     
     def test_sea_level_properties(self):
         """Test that sea level properties match ISA standards"""
@@ -44,6 +45,18 @@ class TestStandardAtmosphere(unittest.TestCase):
         
         self.assertLess(density_10000, density_0)
     
+    def test_numpy_scalar_altitude(self):
+        """Test that NumPy scalars and 0-d arrays work as scalar altitudes"""
+        expected = self.atm.get_atmospheric_properties(5000)
+        for altitude in (np.float64(5000.0), np.int64(5000), np.asarray(5000.0)):
+            self.assertEqual(self.atm.temperature(altitude), expected['temperature'])
+            self.assertEqual(self.atm.pressure(altitude), expected['pressure'])
+            self.assertEqual(self.atm.density(altitude), expected['density'])
+            self.assertEqual(self.atm.speed_of_sound(altitude), expected['speed_of_sound'])
+            self.assertEqual(
+                self.atm.get_atmospheric_properties(altitude)['density'], expected['density']
+            )
+    
     def test_negative_altitude(self):
         """Test behavior at negative altitude (should handle gracefully)"""
         with self.assertRaises(ValueError):
@@ -61,9 +74,54 @@ class TestStandardAtmosphere(unittest.TestCase):
         """Test profile generation function"""
         profile = self.atm.generate_altitude_profile(max_altitude=10000, step=1000)
         
-        self.assertEqual(len(profile), 11)  # 0, 1000, 2000, ..., 10000
-        self.assertEqual(profile[0]['altitude'], 0)
-        self.assertEqual(profile[-1]['altitude'], 10000)
+        self.assertEqual(len(profile['altitude']), 11)  # 0, 1000, 2000, ..., 10000
+        self.assertEqual(profile['altitude'][0], 0)
+        self.assertEqual(profile['altitude'][-1], 10000)
+        
+        for key, values in profile.items():
+            self.assertEqual(values.dtype, np.float64)
+        
+        # Vectorized profile matches the scalar model point by point
+        for row in _aos_view(profile):
+            props = self.atm.get_atmospheric_properties(row['altitude'])
+            for key, value in props.items():
+                self.assertAlmostEqual(row[key], value, delta=1e-9 * max(1.0, abs(value)))
+        
+        # Single-precision profiles hold the same values to float32 accuracy
+        profile32 = self.atm.generate_altitude_profile(max_altitude=10000, step=1000, dtype=np.float32)
+        for key, values in profile32.items():
+            self.assertEqual(values.dtype, np.float32)
+            np.testing.assert_allclose(values, profile[key], rtol=1e-6)
+    
+    def test_array_methods(self):
+        """Test array methods match the scalar model in every layer"""
+        altitudes = np.array([0, 5000, 11000, 15000, 20000, 25000, 32000, 40000, 47000, 50000])
+
+        for name in ['temperature', 'pressure', 'density']:
+            values = getattr(self.atm, name + '_array')(altitudes)
+            self.assertEqual(values.shape, altitudes.shape)
+            for alt, value in zip(altitudes, values):
+                expected = getattr(self.atm, name)(alt)
+                self.assertAlmostEqual(value / expected, 1.0, places=12)
+            
+            # Scalar altitudes keep their (0-d) shape
+            value = getattr(self.atm, name + '_array')(5000.0)
+            self.assertEqual(np.shape(value), ())
+            self.assertAlmostEqual(float(value) / getattr(self.atm, name)(5000.0), 1.0, places=12)
+
+    def test_tabulated_atmosphere(self):
+        """Test lookup-table model matches the exact ISA model"""
+        table_atm = TabulatedAtmosphere()
+        
+        for alt in [0, 1234.5, 11000, 15000, 25000, 40000, 50000]:
+            for name in ['temperature', 'pressure', 'density', 'speed_of_sound']:
+                exact = getattr(self.atm, name)(alt)
+                approx = getattr(table_atm, name)(alt)
+                self.assertAlmostEqual(approx / exact, 1.0, places=6)
+        
+        # Lookup accepts altitude arrays directly
+        densities = table_atm.density(np.array([0, 5000, 10000]))
+        self.assertEqual(densities.shape, (3,))
 
 if __name__ == '__main__':
     unittest.main()
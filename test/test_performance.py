@@ -13,10 +13,11 @@ from src.aircraft_performance import AircraftPerformance
 
 class TestAircraftPerformance(unittest.TestCase):
     
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        self.atm = StandardAtmosphere()
-        self.performance = AircraftPerformance(self.atm)
+    @classmethod
+    def setUpClass(cls):
+        """Set up fixtures shared by all test methods (tests must not mutate them)."""
+        cls.atm = StandardAtmosphere()
+        cls.performance = AircraftPerformance(cls.atm)
     
     def test_lift_coefficient_calculation(self):
         """Test lift coefficient calculation at various conditions."""
@@ -91,6 +92,14 @@ class TestAircraftPerformance(unittest.TestCase):
         CD = self.performance.drag_coefficient(CL)
         expected_thrust = self.performance.drag_force(10000, 250, CD)
         self.assertAlmostEqual(thrust, expected_thrust, places=2)
+        
+        # Velocity arrays give one thrust per velocity
+        velocities = np.array([150, 200, 250])
+        thrusts = self.performance.required_thrust(10000, velocities)
+        self.assertEqual(thrusts.shape, (3,))
+        np.testing.assert_allclose(thrusts, [43636.0, 38651.4, 43772.9], rtol=1e-5)
+        for velocity, value in zip(velocities, thrusts):
+            self.assertAlmostEqual(value / self.performance.required_thrust(10000, velocity), 1.0, places=9)
     
     def test_stall_speed(self):
         """Test stall speed calculation."""
@@ -134,6 +143,10 @@ class TestAircraftPerformance(unittest.TestCase):
         # Test edge case: zero drag coefficient
         L_D_zero = self.performance.lift_to_drag_ratio(0.5, 0)
         self.assertEqual(L_D_zero, 0)
+        
+        # Arrays are handled element-wise, including zero drag entries
+        L_D_array = self.performance.lift_to_drag_ratio(np.array([0.5, 1.0]), np.array([0, 0.1]))
+        np.testing.assert_allclose(L_D_array, [0.0, 10.0])
     
     def test_performance_at_condition(self):
         """Test comprehensive performance calculation."""
@@ -146,7 +159,7 @@ class TestAircraftPerformance(unittest.TestCase):
         ]
         
         for key in required_keys:
-            self.assertIn(key, perf)
+            self.assertIn(key, perf._fields)
             self.assertIsInstance(perf[key], (int, float))
         
         # Verify internal consistency
@@ -163,14 +176,75 @@ class TestAircraftPerformance(unittest.TestCase):
         )
         
         # All values should be positive (except L/D which can be any value)
-        for key, value in perf.items():
+        for key, value in perf._asdict().items():
             if key != 'lift_to_drag_ratio':
                 self.assertGreater(value, 0)
+        
+        # Unknown names behave like a missing dict key
+        with self.assertRaises(KeyError):
+            perf['thrust']
+        with self.assertRaises(KeyError):
+            perf['count']
+    
+    def test_performance_at_conditions(self):
+        """Test vectorized grid calculation matches the scalar path."""
+        altitudes = [0, 5000, 10000, 5000]
+        velocities = [150, 250]
+        grid = self.performance.performance_at_conditions(altitudes, velocities)
+
+        for key, values in grid.items():
+            self.assertEqual(values.shape, (len(altitudes), len(velocities)))
+
+        for i, altitude in enumerate(altitudes):
+            for j, velocity in enumerate(velocities):
+                perf = self.performance.performance_at_condition(altitude, velocity)
+                for key, value in perf._asdict().items():
+                    self.assertAlmostEqual(grid[key][i, j], value, places=6)
+
+    def test_performance_at_conditions_large_grid(self):
+        """Test a large altitude x velocity grid matches the scalar path."""
+        altitudes = np.linspace(0, 15000, 60)
+        velocities = np.linspace(150, 300, 40)
+        grid = self.performance.performance_at_conditions(altitudes, velocities)
+        
+        for i, j in [(0, 0), (17, 31), (59, 39)]:
+            perf = self.performance.performance_at_condition(altitudes[i], velocities[j])
+            for key, value in perf._asdict().items():
+                self.assertAlmostEqual(grid[key][i, j] / value, 1.0, places=9)
     
+    def test_performance_at_condition_array(self):
+        """Test the velocity sweep matches the scalar path point by point."""
+        velocities = np.array([120.0, 200.0, 280.0])
+        sweep = self.performance.performance_at_condition_array(8000, velocities)
+
+        for j, velocity in enumerate(velocities):
+            perf = self.performance.performance_at_condition(8000, velocity)
+            for key, value in perf._asdict().items():
+                self.assertAlmostEqual(sweep[key][j] / value, 1.0, places=9)
+
+    def test_performance_for_aircraft(self):
+        """Test the batched multi-aircraft calculation matches per-aircraft updates."""
+        fleet = {
+            'wing_area': [125.0, 16.2],
+            'mass': [70000.0, 1111.0],
+            'max_lift_coeff': [1.8, 1.6],
+            'zero_lift_drag': [0.02, 0.031],
+            'aspect_ratio': [9.5, 7.5]
+        }
+        batch = self.performance.performance_for_aircraft(3000, 120, fleet)
+
+        for i in range(2):
+            single = AircraftPerformance(self.atm)
+            single.set_aircraft_parameters(**{name: values[i] for name, values in fleet.items()})
+            for key, value in single.performance_at_condition(3000, 120)._asdict().items():
+                self.assertAlmostEqual(batch[key][i], value, places=6)
+
     def test_parameter_update(self):
         """Test aircraft parameter updating functionality."""
-        original_wing_area = self.performance.default_params['wing_area']
-        original_mass = self.performance.default_params['mass']
+        # Use a fresh model so the shared fixture keeps its default parameters
+        performance = AircraftPerformance(self.atm)
+        original_wing_area = performance.default_params['wing_area']
+        original_mass = performance.default_params['mass']
         
         new_params = {
             'wing_area': 150.0,
@@ -181,15 +255,15 @@ class TestAircraftPerformance(unittest.TestCase):
         }
         
         # Update parameters
-        self.performance.set_aircraft_parameters(**new_params)
+        performance.set_aircraft_parameters(**new_params)
         
         # Verify updates
         for param, value in new_params.items():
-            self.assertEqual(self.performance.default_params[param], value)
+            self.assertEqual(performance.default_params[param], value)
         
         # Test that performance calculations use new parameters
         perf_original = AircraftPerformance(self.atm).performance_at_condition(10000, 250)
-        perf_updated = self.performance.performance_at_condition(10000, 250)
+        perf_updated = performance.performance_at_condition(10000, 250)
         
         # Performance should be different with different parameters
         self.assertNotAlmostEqual(
@@ -197,7 +271,36 @@ class TestAircraftPerformance(unittest.TestCase):
             perf_updated['required_thrust'],
             places=2
         )
-    
+
+        # Re-applying the same parameters leaves the results unchanged
+        performance.set_aircraft_parameters(**new_params)
+        self.assertEqual(performance.performance_at_condition(10000, 250), perf_updated)
+
+        # Attributes assigned directly take effect immediately
+        performance.mass = original_mass
+        self.assertLess(performance.required_thrust(10000, 250), perf_updated['required_thrust'])
+        self.assertAlmostEqual(
+            performance.performance_at_condition(10000, 250).lift_force, original_mass * 9.81, places=6
+        )
+
+        # The parameter mapping is read-only
+        with self.assertRaises(TypeError):
+            performance.default_params['mass'] = 2 * original_mass
+        self.assertEqual(performance.mass, original_mass)
+
+        # Configuration metadata is accepted, misspelt parameters are rejected
+        performance.set_aircraft_parameters(name='Test Aircraft', description='Test')
+        with self.assertRaises(TypeError):
+            performance.set_aircraft_parameters(wingarea=200)
+        
+        # Updating back to an earlier value after a direct assignment is not skipped
+        performance.mass = 2 * original_mass
+        performance.set_aircraft_parameters(mass=original_mass)
+        self.assertEqual(performance.mass, original_mass)
+        self.assertAlmostEqual(
+            performance.performance_at_condition(10000, 250).lift_force, original_mass * 9.81, places=6
+        )
+
     def test_edge_cases(self):
         """Test performance calculations at edge cases."""
         # Very low altitude
@@ -4,290 +4,125 @@ Unit tests for utility functions
 
 import sys
 import os
-import unittest
-import tempfile
+import io
 import json
 import numpy as np
+import pytest
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from src.utils import *
 
-class TestUtils(unittest.TestCase):
-    
-    def setUp(self):
-        """Set up test fixtures before each test method."""
-        # Create a temporary aircraft config file for testing
-        self.temp_config = {
-            "test_aircraft": {
-                "name": "Test Aircraft",
-                "wing_area": 100.0,
-                "mass": 50000.0,
-                "max_lift_coeff": 1.8,
-                "zero_lift_drag": 0.02,
-                "oswald_efficiency": 0.85,
-                "aspect_ratio": 9.0,
-                "description": "Test aircraft configuration"
-            },
-            "another_aircraft": {
-                "name": "Another Test Aircraft",
-                "wing_area": 150.0,
-                "mass": 75000.0
-            }
+
+@pytest.fixture(scope="module")
+def config_path(tmp_path_factory):
+    """Write the shared aircraft config file once for the whole module."""
+    # Create a temporary aircraft config file for testing
+    temp_config = {
+        "test_aircraft": {
+            "name": "Test Aircraft",
+            "wing_area": 100.0,
+            "mass": 50000.0,
+            "max_lift_coeff": 1.8,
+            "zero_lift_drag": 0.02,
+            "oswald_efficiency": 0.85,
+            "aspect_ratio": 9.0,
+            "description": "Test aircraft configuration"
+        },
+        "another_aircraft": {
+            "name": "Another Test Aircraft",
+            "wing_area": 150.0,
+            "mass": 75000.0
         }
-        
-        self.temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False)
-        json.dump(self.temp_config, self.temp_file)
-        self.temp_file.close()
-    
-    def tearDown(self):
-        """Clean up after each test method."""
-        if os.path.exists(self.temp_file.name):
-            os.unlink(self.temp_file.name)
+    }
+
+    path = tmp_path_factory.mktemp("config") / "aircraft.json"
+    path.write_text(json.dumps(temp_config))
+    return str(path)
+
+
+class TestUtils:
     
-    def test_load_aircraft_config(self):
+    def test_load_aircraft_config(self, config_path):
         """Test loading aircraft configuration from JSON file."""
         # Test successful load
-        config = load_aircraft_config(self.temp_file.name)
+        config = load_aircraft_config(config_path)
         
-        self.assertIsInstance(config, dict)
-        self.assertIn('test_aircraft', config)
-        self.assertIn('another_aircraft', config)
+        assert isinstance(config, dict)
+        assert 'test_aircraft' in config
+        assert 'another_aircraft' in config
         
         # Verify data integrity
-        self.assertEqual(config['test_aircraft']['name'], 'Test Aircraft')
-        self.assertEqual(config['test_aircraft']['wing_area'], 100.0)
-        self.assertEqual(config['test_aircraft']['mass'], 50000.0)
+        assert config['test_aircraft']['name'] == 'Test Aircraft'
+        assert config['test_aircraft']['wing_area'] == 100.0
+        assert config['test_aircraft']['mass'] == 50000.0
         
         # Test file not found
-        with self.assertRaises(FileNotFoundError):
+        with pytest.raises(FileNotFoundError):
             load_aircraft_config('nonexistent_file.json')
     
-    def test_save_aircraft_config(self):
-        """Test saving aircraft configuration to JSON file."""
-        test_config = {
-            "new_aircraft": {
-                "name": "New Test Aircraft",
-                "wing_area": 200.0,
-                "mass": 60000.0,
-                "description": "New test configuration"
-            }
-        }
-        
-        # Create temporary file for saving
-        with tempfile.NamedTemporaryFile(mode='r', suffix='.json', delete=False) as tmp_file:
-            tmp_path = tmp_file.name
-        
-        try:
-            # Save configuration
-            save_aircraft_config(test_config, tmp_path)
-            
-            # Verify file was created and contains correct data
-            self.assertTrue(os.path.exists(tmp_path))
-            
-            with open(tmp_path, 'r') as f:
-                loaded_config = json.load(f)
-            
-            self.assertIn('new_aircraft', loaded_config)
-            self.assertEqual(loaded_config['new_aircraft']['name'], 'New Test Aircraft')
-            self.assertEqual(loaded_config['new_aircraft']['wing_area'], 200.0)
-            
-        finally:
-            # Clean up
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
-    
-    def test_validate_altitude(self):
-        """Test altitude validation function."""
-        # Valid altitudes
-        valid_altitudes = [0, 1000, 10000, 25000, 50000]
-        for alt in valid_altitudes:
-            self.assertTrue(validate_altitude(alt), f"Altitude {alt} should be valid")
-        
-        # Invalid altitudes
-        invalid_altitudes = [-1000, -1, 50001, 100000]
-        for alt in invalid_altitudes:
-            self.assertFalse(validate_altitude(alt), f"Altitude {alt} should be invalid")
-        
-        # Boundary cases
-        self.assertTrue(validate_altitude(0))
-        self.assertTrue(validate_altitude(50000))
-        self.assertFalse(validate_altitude(50001))
-        self.assertFalse(validate_altitude(-1))
-    
-    def test_validate_velocity(self):
-        """Test velocity validation function."""
-        # Valid velocities
-        valid_velocities = [1, 50, 100, 250, 500, 1000]
-        for vel in valid_velocities:
-            self.assertTrue(validate_velocity(vel), f"Velocity {vel} should be valid")
-        
-        # Invalid velocities
-        invalid_velocities = [0, -100, -1, 1001, 1500]
-        for vel in invalid_velocities:
-            self.assertFalse(validate_velocity(vel), f"Velocity {vel} should be invalid")
-        
-        # Boundary cases
-        self.assertTrue(validate_velocity(1))
-        self.assertTrue(validate_velocity(1000))
-        self.assertFalse(validate_velocity(0))
-        self.assertFalse(validate_velocity(1001))
-    
     def test_unit_conversions_length(self):
         """Test length unit conversion functions."""
-        # Meters to feet and back
-        test_values = [0, 1, 1000, 10000, 1524]  # 1524m = 5000ft approx
-        
-        for meters in test_values:
-            feet = meters_to_feet(meters)
-            meters_back = feet_to_meters(feet)
-            
-            self.assertIsInstance(feet, float)
-            self.assertIsInstance(meters_back, float)
-            self.assertAlmostEqual(meters, meters_back, places=4,
-                                 msg=f"Conversion round-trip failed for {meters}m")
-        
         # Specific known values
-        self.assertAlmostEqual(meters_to_feet(1), 3.28084, places=4)
-        self.assertAlmostEqual(feet_to_meters(3.28084), 1.0, places=4)
-        self.assertAlmostEqual(meters_to_feet(1000), 3280.84, places=2)
+        assert meters_to_feet(1) == pytest.approx(3.28084, abs=1e-4)
+        assert feet_to_meters(3.28084) == pytest.approx(1.0, abs=1e-4)
+        assert meters_to_feet(1000) == pytest.approx(3280.84, abs=1e-2)
+        
+        # Whole arrays convert element-wise
+        np.testing.assert_allclose(meters_to_feet(np.array([0.0, 1000.0])), [0.0, 3280.84])
     
     def test_unit_conversions_velocity(self):
         """Test velocity unit conversion functions."""
-        # m/s to knots and back
-        test_values = [0, 1, 50, 100, 250, 300]
-        
-        for mps in test_values:
-            knots = mps_to_knots(mps)
-            mps_back = knots_to_mps(knots)
-            
-            self.assertIsInstance(knots, float)
-            self.assertIsInstance(mps_back, float)
-            self.assertAlmostEqual(mps, mps_back, places=4,
-                                 msg=f"Conversion round-trip failed for {mps} m/s")
-        
         # Specific known values
-        self.assertAlmostEqual(mps_to_knots(1), 1.94384, places=4)
-        self.assertAlmostEqual(knots_to_mps(1.94384), 1.0, places=4)
-        self.assertAlmostEqual(mps_to_knots(100), 194.384, places=2)
+        assert mps_to_knots(1) == pytest.approx(1.94384, abs=1e-4)
+        assert knots_to_mps(1.94384) == pytest.approx(1.0, abs=1e-4)
+        assert mps_to_knots(100) == pytest.approx(194.384, abs=1e-2)
     
     def test_mach_number_calculation(self):
         """Test Mach number calculation."""
-        # Normal cases
-        test_cases = [
-            (300, 340, 300/340),  # Subsonic
-            (340, 340, 1.0),      # Sonic
-            (400, 340, 400/340),  # Supersonic
-        ]
-        
-        for velocity, speed_of_sound, expected_mach in test_cases:
-            mach = calculate_mach_number(velocity, speed_of_sound)
-            self.assertAlmostEqual(mach, expected_mach, places=6)
-            self.assertIsInstance(mach, float)
-        
         # Edge case: zero speed of sound
         mach_zero = calculate_mach_number(300, 0)
-        self.assertEqual(mach_zero, 0)
+        assert mach_zero == 0
         
         # Edge case: zero velocity
         mach_zero_vel = calculate_mach_number(0, 340)
-        self.assertEqual(mach_zero_vel, 0)
-    
-    def test_dynamic_pressure_calculation(self):
-        """Test dynamic pressure calculation."""
-        test_cases = [
-            (1.225, 100, 6125.0),    # Sea level, 100 m/s
-            (0.5, 200, 10000.0),     # High altitude, high speed
-            (0.1, 300, 4500.0),      # Very high altitude, very high speed
-        ]
-        
-        for density, velocity, expected_pressure in test_cases:
-            q = calculate_dynamic_pressure(density, velocity)
-            expected = 0.5 * density * velocity**2
-            self.assertAlmostEqual(q, expected, places=2)
-            self.assertIsInstance(q, float)
-        
-        # Edge cases
-        self.assertEqual(calculate_dynamic_pressure(0, 100), 0)
-        self.assertEqual(calculate_dynamic_pressure(1.225, 0), 0)
+        assert mach_zero_vel == 0
     
     def test_unit_converter_class(self):
         """Test UnitConverter class methods."""
         # Pressure conversions
-        self.assertAlmostEqual(UnitConverter.pressure_pa_to_inhg(101325), 29.92, places=1)
-        self.assertAlmostEqual(UnitConverter.pressure_pa_to_psi(101325), 14.7, places=1)
+        assert UnitConverter.pressure_pa_to_inhg(101325) == pytest.approx(29.92, abs=0.1)
+        assert UnitConverter.pressure_pa_to_psi(101325) == pytest.approx(14.7, abs=0.1)
         
         # Test round-trip consistency (approximate due to floating point)
         pa_value = 50000
         inhg = UnitConverter.pressure_pa_to_inhg(pa_value)
-        self.assertIsInstance(inhg, float)
+        assert isinstance(inhg, float)
         
         psi = UnitConverter.pressure_pa_to_psi(pa_value)
-        self.assertIsInstance(psi, float)
-        
-        # Temperature conversions
-        test_temperatures = [-40, 0, 15, 100]  # Celsius
-        
-        for celsius in test_temperatures:
-            fahrenheit = UnitConverter.temperature_c_to_f(celsius)
-            expected = celsius * 9/5 + 32
-            self.assertAlmostEqual(fahrenheit, expected, places=2)
-            self.assertIsInstance(fahrenheit, float)
+        assert isinstance(psi, float)
         
         # Specific known values
-        self.assertAlmostEqual(UnitConverter.temperature_c_to_f(0), 32.0, places=1)
-        self.assertAlmostEqual(UnitConverter.temperature_c_to_f(100), 212.0, places=1)
-        self.assertAlmostEqual(UnitConverter.temperature_c_to_f(-40), -40.0, places=1)
+        assert UnitConverter.temperature_c_to_f(0) == pytest.approx(32.0, abs=0.1)
+        assert UnitConverter.temperature_c_to_f(100) == pytest.approx(212.0, abs=0.1)
+        assert UnitConverter.temperature_c_to_f(-40) == pytest.approx(-40.0, abs=0.1)
         
         # Force conversions
-        self.assertAlmostEqual(UnitConverter.force_n_to_lbf(4.44822), 1.0, places=4)
-        self.assertAlmostEqual(UnitConverter.force_n_to_lbf(1000), 1000/4.44822, places=2)
-        
-        # Test various force values
-        test_forces = [1, 100, 1000, 10000]  # Newtons
-        
-        for newtons in test_forces:
-            lbf = UnitConverter.force_n_to_lbf(newtons)
-            self.assertIsInstance(lbf, float)
-            self.assertGreater(lbf, 0)
+        assert UnitConverter.force_n_to_lbf(4.44822) == pytest.approx(1.0, abs=1e-4)
+        assert UnitConverter.force_n_to_lbf(1000) == pytest.approx(1000/4.44822, abs=1e-2)
     
     def test_unit_converter_edge_cases(self):
         """Test UnitConverter with edge cases."""
         # Zero and negative values
-        self.assertEqual(UnitConverter.pressure_pa_to_inhg(0), 0)
-        self.assertEqual(UnitConverter.pressure_pa_to_psi(0), 0)
-        self.assertEqual(UnitConverter.force_n_to_lbf(0), 0)
+        assert UnitConverter.pressure_pa_to_inhg(0) == 0
+        assert UnitConverter.pressure_pa_to_psi(0) == 0
+        assert UnitConverter.force_n_to_lbf(0) == 0
         
         # Negative pressure (should handle gracefully)
         negative_inhg = UnitConverter.pressure_pa_to_inhg(-1000)
-        self.assertIsInstance(negative_inhg, float)
+        assert isinstance(negative_inhg, float)
         
         negative_psi = UnitConverter.pressure_pa_to_psi(-1000)
-        self.assertIsInstance(negative_psi, float)
-    
-    def test_configuration_file_errors(self):
-        """Test error handling for configuration files."""
-        # Test invalid JSON file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as bad_file:
-            bad_file.write("invalid json content {")
-            bad_path = bad_file.name
-        
-        try:
-            with self.assertRaises(ValueError):
-                load_aircraft_config(bad_path)
-        finally:
-            if os.path.exists(bad_path):
-                os.unlink(bad_path)
-        
-        # Test empty file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as empty_file:
-            empty_path = empty_file.name
-        
-        try:
-            with self.assertRaises(ValueError):
-                load_aircraft_config(empty_path)
-        finally:
-            if os.path.exists(empty_path):
-                os.unlink(empty_path)
+        assert isinstance(negative_psi, float)
     
     def test_comprehensive_unit_conversion(self):
         """Test comprehensive unit conversion scenarios."""
@@ -299,16 +134,186 @@ class TestUtils(unittest.TestCase):
         altitude_ft = meters_to_feet(altitude_m)
         velocity_kts = mps_to_knots(velocity_ms)
         
-        self.assertAlmostEqual(altitude_ft, 32808.4, places=1)
-        self.assertAlmostEqual(velocity_kts, 485.96, places=1)
+        assert altitude_ft == pytest.approx(32808.4, abs=0.1)
+        assert velocity_kts == pytest.approx(485.96, abs=0.1)
         
         # Convert back
         altitude_back = feet_to_meters(altitude_ft)
         velocity_back = knots_to_mps(velocity_kts)
         
-        self.assertAlmostEqual(altitude_back, altitude_m, places=4)
-        self.assertAlmostEqual(velocity_back, velocity_ms, places=4)
+        assert altitude_back == pytest.approx(altitude_m, abs=1e-4)
+        assert velocity_back == pytest.approx(velocity_ms, abs=1e-4)
+
+
+def test_save_aircraft_config(tmp_path):
+    """Test saving aircraft configuration to JSON file."""
+    test_config = {
+        "new_aircraft": {
+            "name": "New Test Aircraft",
+            "wing_area": 200.0,
+            "mass": 60000.0,
+            "description": "New test configuration"
+        }
+    }
+    config_path = tmp_path / "config.json"
+    
+    save_aircraft_config(test_config, str(config_path))
+    
+    # The file holds exactly the indented JSON document
+    assert config_path.read_bytes() == json.dumps(test_config, indent=2).encode()
+
+
+def test_configuration_file_errors():
+    """Test error handling for configuration files."""
+    # Invalid JSON content
+    with pytest.raises(ValueError):
+        load_aircraft_config(io.StringIO("invalid json content {"))
+    
+    # Empty file
+    with pytest.raises(ValueError):
+        load_aircraft_config(io.BytesIO(b""))
+
+
+def test_load_aircraft_config_file_object():
+    """Test loading a configuration from an open file-like object."""
+    config = load_aircraft_config(io.BytesIO(b'{"aircraft": {"mass": 50000.0}}'))
+    
+    assert config == {"aircraft": {"mass": 50000.0}}
 
-if __name__ == '__main__':
-    # Run the tests
-    unittest.main(verbosity=2)
\ No newline at end of file
+
+_VALID_ALTITUDES = [0, 1000, 10000, 25000, 50000]
+_INVALID_ALTITUDES = [-1000, -1, 50001, 100000]
+_VALID_VELOCITIES = [1, 50, 100, 250, 500, 1000]
+_INVALID_VELOCITIES = [0, -100, -1, 1001, 1500]
+
+
+@pytest.mark.parametrize("altitude", _VALID_ALTITUDES)
+def test_validate_altitude_valid(altitude):
+    """Test altitudes inside the model range are accepted."""
+    assert validate_altitude(altitude) is True
+
+
+@pytest.mark.parametrize("altitude", _INVALID_ALTITUDES)
+def test_validate_altitude_invalid(altitude):
+    """Test altitudes outside the model range are rejected."""
+    assert validate_altitude(altitude) is False
+
+
+def test_validate_altitude_array():
+    """Test altitude validation over valid and invalid values at once."""
+    altitudes = np.array(_VALID_ALTITUDES + _INVALID_ALTITUDES)
+    expected = np.array([True] * len(_VALID_ALTITUDES) + [False] * len(_INVALID_ALTITUDES))
+    
+    np.testing.assert_array_equal(validate_altitude(altitudes), expected)
+
+
+@pytest.mark.parametrize("velocity", _VALID_VELOCITIES)
+def test_validate_velocity_valid(velocity):
+    """Test velocities inside the allowed range are accepted."""
+    assert validate_velocity(velocity) is True
+
+
+@pytest.mark.parametrize("velocity", _INVALID_VELOCITIES)
+def test_validate_velocity_invalid(velocity):
+    """Test velocities outside the allowed range are rejected."""
+    assert validate_velocity(velocity) is False
+
+
+def test_validate_velocity_array():
+    """Test velocity validation over valid and invalid values at once."""
+    velocities = np.array(_VALID_VELOCITIES + _INVALID_VELOCITIES)
+    expected = np.array([True] * len(_VALID_VELOCITIES) + [False] * len(_INVALID_VELOCITIES))
+    
+    np.testing.assert_array_equal(validate_velocity(velocities), expected)
+
+
+def test_length_round_trip():
+    """Test meters to feet and back for a whole array at once."""
+    meters = np.array([0, 1, 1000, 10000, 1524], dtype=np.float64)  # 1524m = 5000ft approx
+    
+    np.testing.assert_allclose(feet_to_meters(meters_to_feet(meters)), meters, rtol=0, atol=1e-4)
+    assert isinstance(feet_to_meters(meters_to_feet(1524)), float)
+
+
+def test_velocity_round_trip():
+    """Test m/s to knots and back for a whole array at once."""
+    mps = np.array([0, 1, 50, 100, 250, 300], dtype=np.float64)
+    
+    np.testing.assert_allclose(knots_to_mps(mps_to_knots(mps)), mps, rtol=0, atol=1e-4)
+    assert isinstance(knots_to_mps(mps_to_knots(250)), float)
+
+
+@pytest.mark.parametrize("velocity, speed_of_sound, expected_mach", [
+    (300, 340, 300/340),  # Subsonic
+    (340, 340, 1.0),      # Sonic
+    (400, 340, 400/340),  # Supersonic
+])
+def test_mach_number(velocity, speed_of_sound, expected_mach):
+    """Test Mach number in each flight regime."""
+    mach = calculate_mach_number(velocity, speed_of_sound)
+    
+    assert isinstance(mach, float)
+    assert mach == pytest.approx(expected_mach, abs=1e-6)
+
+
+_DYNAMIC_PRESSURE_CASES = [
+    (1.225, 100, 6125.0),    # Sea level, 100 m/s
+    (0.5, 200, 10000.0),     # High altitude, high speed
+    (0.1, 300, 4500.0),      # Very high altitude, very high speed
+]
+
+
+@pytest.mark.parametrize("density, velocity, expected_pressure", _DYNAMIC_PRESSURE_CASES)
+def test_dynamic_pressure(density, velocity, expected_pressure):
+    """Test dynamic pressure calculation."""
+    q = calculate_dynamic_pressure(density, velocity)
+    
+    assert isinstance(q, float)
+    assert q == pytest.approx(expected_pressure, abs=1e-2)
+
+
+def test_dynamic_pressure_array():
+    """Test dynamic pressure calculation on arrays of conditions."""
+    cases = np.array(_DYNAMIC_PRESSURE_CASES)
+    q = calculate_dynamic_pressure(cases[:, 0], cases[:, 1])
+    
+    np.testing.assert_allclose(q, cases[:, 2], rtol=0, atol=1e-2)
+
+
+def test_dynamic_pressure_edge_cases():
+    """Test dynamic pressure with zero density or velocity."""
+    assert calculate_dynamic_pressure(0, 100) == 0
+    assert calculate_dynamic_pressure(1.225, 0) == 0
+
+
+_CELSIUS = [-40, 0, 15, 100]
+_NEWTONS = [1, 100, 1000, 10000]
+
+
+@pytest.mark.parametrize("celsius", _CELSIUS)
+def test_temperature_c_to_f(celsius):
+    """Test Celsius to Fahrenheit conversion."""
+    fahrenheit = UnitConverter.temperature_c_to_f(celsius)
+    
+    assert isinstance(fahrenheit, float)
+    assert fahrenheit == pytest.approx(celsius * 9/5 + 32, abs=1e-2)
+
+
+@pytest.mark.parametrize("newtons", _NEWTONS)
+def test_force_n_to_lbf(newtons):
+    """Test Newtons to pound-force conversion."""
+    lbf = UnitConverter.force_n_to_lbf(newtons)
+    
+    assert isinstance(lbf, float)
+    assert lbf > 0
+
+
+def test_unit_converter_arrays():
+    """Test the UnitConverter methods on whole arrays."""
+    c2f = UnitConverter.temperature_c_to_f
+    n2lbf = UnitConverter.force_n_to_lbf
+    celsius = np.array(_CELSIUS, dtype=np.float64)
+    newtons = np.array(_NEWTONS, dtype=np.float64)
+    
+    np.testing.assert_allclose(c2f(celsius), celsius * 9/5 + 32, rtol=0, atol=1e-2)
+    assert np.all(n2lbf(newtons) > 0)
@@ -4,76 +4,111 @@ Unit tests for visualization module
 
 import sys
 import os
-import unittest
-import tempfile
+import io
+import numpy as np
+import pytest
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from src.atmosphere_model import StandardAtmosphere
-from src.aircraft_performance import AircraftPerformance
-from src.visualization import AtmosphereVisualizer
+# matplotlib and the visualizer are imported inside fixtures and tests, so
+# collecting this module stays cheap
 
-class TestVisualization(unittest.TestCase):
-    
-    def setUp(self):
-        self.atm = StandardAtmosphere()
-        self.performance = AircraftPerformance(self.atm)
-        self.visualizer = AtmosphereVisualizer()
-        
-        # Generate sample data for testing
-        self.profile = self.atm.generate_altitude_profile(max_altitude=10000, step=1000)
-        
-        # Generate sample performance data
-        self.altitudes = [0, 5000, 10000]
-        self.performance_data = []
-        for alt in self.altitudes:
-            perf = self.performance.performance_at_condition(alt, 250)
-            self.performance_data.append(perf)
+@pytest.fixture(autouse=True)
+def _close_figures():
+    """Release every figure a test opened; pyplot keeps them alive otherwise"""
+    yield
+    import matplotlib.pyplot as plt
+    plt.close('all')
+
+class TestVisualization:
+    """Plot tests; the models and sample data are session fixtures from conftest.py"""
     
-    def test_visualizer_initialization(self):
+    def test_visualizer_initialization(self, visualizer):
         """Test visualization class initialization"""
-        self.assertIsInstance(self.visualizer, AtmosphereVisualizer)
-        self.assertEqual(self.visualizer.fig_size, (10, 6))
+        from src.visualization import AtmosphereVisualizer
+        assert isinstance(visualizer, AtmosphereVisualizer)
+        assert visualizer.fig_size == (10, 6)
     
-    def test_atmospheric_properties_plot(self):
+    def test_atmospheric_properties_plot(self, visualizer, profile):
         """Test atmospheric properties plotting"""
-        fig = self.visualizer.plot_atmospheric_properties(self.profile)
+        fig = visualizer.plot_atmospheric_properties(profile)
         
-        self.assertIsNotNone(fig)
-        self.assertEqual(len(fig.axes), 4)  # Should have 4 subplots
+        assert fig is not None
+        assert len(fig.axes) == 4  # Should have 4 subplots
     
-    def test_performance_curves_plot(self):
+    def test_performance_curves_plot(self, visualizer, performance_data, altitudes):
         """Test performance curves plotting"""
-        fig = self.visualizer.plot_performance_curves(
-            self.performance_data, 
-            self.altitudes, 
+        fig = visualizer.plot_performance_curves(
+            performance_data, 
+            altitudes, 
             250
         )
         
-        self.assertIsNotNone(fig)
-        self.assertEqual(len(fig.axes), 4)  # Should have 4 subplots
+        assert fig is not None
+        assert len(fig.axes) == 4  # Should have 4 subplots
     
-    def test_thrust_drag_curves_plot(self):
+    def test_performance_curves_plot_columns(self, visualizer, performance, altitudes):
+        """Test performance curves plotting from column-oriented data"""
+        grid = performance.performance_at_conditions(altitudes, 250)
+        columns = {key: values[:, 0] for key, values in grid.items()}
+        fig = visualizer.plot_performance_curves(columns, altitudes, 250)
+        
+        assert fig is not None
+        assert len(fig.axes) == 4
+    
+    def test_thrust_drag_curves_plot(self, visualizer, performance):
         """Test thrust-drag curves plotting"""
         velocities = [150, 200, 250, 300]
-        fig = self.visualizer.plot_thrust_drag_curves(
-            self.performance,
+        fig = visualizer.plot_thrust_drag_curves(
+            performance,
             10000,
             velocities
         )
         
-        self.assertIsNotNone(fig)
-        self.assertEqual(len(fig.axes), 2)  # Should have 2 subplots
+        assert fig is not None
+        assert len(fig.axes) == 2  # Should have 2 subplots
+    
+    def test_thrust_drag_curves_precomputed(self, visualizer, performance):
+        """Test that a precomputed velocity sweep is plotted without recomputing"""
+        velocities = [150, 200, 250, 300]
+        perf = performance.performance_at_condition_array(10000, velocities)
+        fig = visualizer.plot_thrust_drag_curves(None, 10000, velocities, perf=perf)
+        
+        assert len(fig.axes) == 2
+        np.testing.assert_allclose(fig.axes[0].lines[0].get_ydata(), perf.required_thrust / 1000)
     
-    def test_plot_saving(self):
-        """Test that plots can be saved to file"""
-        fig = self.visualizer.plot_atmospheric_properties(self.profile)
+    def test_plot_into_existing_figure(self, visualizer, performance):
+        """Test that a preallocated figure is cleared and reused"""
+        fig = visualizer.plot_thrust_drag_curves(performance, 10000, [150, 250])
+        reused = visualizer.plot_thrust_drag_curves(performance, 5000, [150, 250], fig=fig)
         
-        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as tmp_file:
-            fig.savefig(tmp_file.name, dpi=100, bbox_inches='tight')
-            self.assertTrue(os.path.exists(tmp_file.name))
-            
-            # Clean up
-            os.unlink(tmp_file.name)
+        assert reused is fig
+        assert len(fig.axes) == 2
+
+    def test_reuse_figures(self, performance, profile):
+        """Test that a reusing visualizer redraws one figure per plot kind"""
+        from src.visualization import AtmosphereVisualizer
+        visualizer = AtmosphereVisualizer(reuse_figures=True)
+        fig_td = visualizer.plot_thrust_drag_curves(performance, 10000, [150, 250])
+        fig_atm = visualizer.plot_atmospheric_properties(profile)
+
+        assert visualizer.plot_thrust_drag_curves(performance, 5000, [150, 250]) is fig_td
+        assert visualizer.plot_atmospheric_properties(profile) is fig_atm
+        assert fig_td is not fig_atm
+        assert len(fig_td.axes) == 2
 
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    def test_plot_saving(self, visualizer, profile):
+        """Test that plots can be saved as PNG"""
+        fig = visualizer.plot_atmospheric_properties(profile)
+        buf = io.BytesIO()
+        
+        fig.savefig(buf, format='png', dpi=50, bbox_inches='tight')
+        assert buf.getvalue().startswith(b'\x89PNG')
+
+    @pytest.mark.slow
+    def test_plot_saving_full_resolution(self, visualizer, full_profile):
+        """Test saving a full-height, fine-step profile at print resolution"""
+        fig = visualizer.plot_atmospheric_properties(full_profile)
+        buf = io.BytesIO()
+        
+        fig.savefig(buf, format='png', dpi=300, bbox_inches='tight')
+        assert buf.getvalue().startswith(b'\x89PNG')